@@ -0,0 +1,59 @@
+"""
+Isaac Sim 부력 시뮬레이션 패키지
+
+하위 모듈은 처음 접근할 때 불러온다 (import Scripts 자체는 아무것도 불러오지 않음).
+
+- 코어 (numpy만 필요, omni/pxr 없이 헤드리스 사용 가능):
+  WaveComponents, SeaStateProfile, SeaStateTrack, BuoyancySolver,
+  BuoyancyRegistry, BuoyantObject, BuoyancyPrototype, WaterBody, WaterBodyRegistry, RippleField,
+  BuoyancyRecorder, BuoyancyLog, BuoyancyReplay, BatchRunner
+- Kit 전용 (omni/pxr 필요):
+  BuoyancyManager, BuoyancyUI, BuoyancyPhysics, SceneSetup, WaveMesh, ForceWriter,
+  PrototypeLibrary (pxr는 acquire 시점에 필요)
+"""
+import importlib
+
+# 공개 이름 -> 하위 모듈
+_EXPORTS = {
+    # 코어
+    "WaveComponents": "wave_field",
+    "SeaStateProfile": "sea_state",
+    "SeaStateTrack": "sea_state",
+    "BuoyancySolver": "buoyancy_solver",
+    "BuoyancyResult": "buoyancy_solver",
+    "BuoyancyRegistry": "buoyancy_registry",
+    "BuoyantObject": "buoyant_object",
+    "BuoyancyPrototype": "buoyancy_prototype",
+    "PrototypeLibrary": "buoyancy_prototype",
+    "WaterBody": "water_body",
+    "WaterBodyRegistry": "water_body",
+    "RippleField": "ripple_field",
+    "RippleSurface": "ripple_field",
+    "BuoyancyRecorder": "buoyancy_recorder",
+    "BuoyancyLog": "buoyancy_recorder",
+    "BuoyancyReplay": "buoyancy_recorder",
+    "BatchRunner": "batch_runner",
+    "RigidBodyIntegrator": "batch_runner",
+    # Kit 전용
+    "BuoyancyManager": "buoyancy_manager",
+    "BuoyancyUI": "buoyancy_ui",
+    "BuoyancyPhysics": "buoyancy_physics",
+    "SceneSetup": "scene_setup",
+    "WaveMesh": "wave_mesh",
+    "ForceWriter": "force_writer",
+}
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,275 @@
+"""
+오프라인 배치 시뮬레이션 (Kit 없이 파라미터 스윕)
+
+물체(크기, 밀도, 항력 계수) x 해상 상태(진폭, 파장, 속도, 경사도) 조합을
+간단한 강체 적분기로 시뮬레이션하고 요약 지표를 CSV/Parquet로 저장한다.
+
+사용법 (저장소 루트에서):
+    python -m Scripts.batch_runner --densities 50 200 500 --drag 0.5 1.0 \\
+        --amplitudes 0.1 0.3 --steepness 0.2 0.5 --out results.csv
+"""
+import csv
+import itertools
+import math
+import os
+import time as _time
+
+import numpy as np
+
+from .buoyancy_prototype import BuoyancyPrototype
+from .buoyancy_solver import BuoyancySolver
+from .wave_field import WaveComponents
+
+
+# 지표 컬럼 순서
+RESULT_COLUMNS = [
+    "scenario", "size_x", "size_y", "size_z", "material_density", "drag_coefficient",
+    "amplitude", "wavelength", "speed", "steepness", "num_waves",
+    "heave_rms", "roll_rms_deg", "pitch_rms_deg", "equilibrium_draft", "expected_draft",
+    "mean_submerged_ratio", "final_z", "sim_time", "wall_time",
+]
+
+
+class RigidBodyIntegrator:
+    """박스 강체 semi-implicit Euler 적분 (행 벡터 규약, PhysX 감쇠와 동일한 계수)"""
+
+    def __init__(self, size, mass, linear_damping=0.1, angular_damping=0.5, gravity=9.81):
+        self.mass = mass
+        self.gravity = gravity
+        self.linear_damping = linear_damping
+        self.angular_damping = angular_damping
+
+        sx, sy, sz = size
+        self.inertia_body = np.diag([
+            mass * (sy * sy + sz * sz) / 12.0,
+            mass * (sx * sx + sz * sz) / 12.0,
+            mass * (sx * sx + sy * sy) / 12.0,
+        ])
+        self.inertia_body_inv = np.linalg.inv(self.inertia_body)
+
+        self.rotation = np.eye(3)  # 행 = 로컬 축의 월드 방향
+        self.position = np.zeros(3)
+        self.velocity = np.zeros(3)
+        self.angular_velocity = np.zeros(3)
+
+    def matrix(self):
+        """로컬 -> 월드 4x4 변환"""
+        m = np.eye(4)
+        m[:3, :3] = self.rotation
+        m[3, :3] = self.position
+        return m
+
+    def step(self, force, torque, dt):
+        """힘/토크(월드 좌표) 적용 후 dt만큼 진행"""
+        acceleration = force / self.mass
+        acceleration[2] -= self.gravity
+        self.velocity = (self.velocity + acceleration * dt) / (1.0 + dt * self.linear_damping)
+
+        rot = self.rotation
+        inertia_world_inv = rot.T @ self.inertia_body_inv @ rot
+        self.angular_velocity = ((self.angular_velocity + inertia_world_inv @ torque * dt)
+                                 / (1.0 + dt * self.angular_damping))
+
+        self.position = self.position + self.velocity * dt
+
+        angle = np.linalg.norm(self.angular_velocity) * dt
+        if angle > 1e-12:
+            axis = self.angular_velocity / np.linalg.norm(self.angular_velocity)
+            k = np.array([
+                [0.0, -axis[2], axis[1]],
+                [axis[2], 0.0, -axis[0]],
+                [-axis[1], axis[0], 0.0],
+            ])
+            delta = np.eye(3) + math.sin(angle) * k + (1.0 - math.cos(angle)) * (k @ k)
+            self.rotation = rot @ delta.T
+
+    def roll_pitch(self):
+        """roll (x축), pitch (y축) 각도 [rad]"""
+        rot = self.rotation
+        roll = math.atan2(rot[1][2], rot[2][2])
+        pitch = math.atan2(-rot[0][2], math.hypot(rot[1][2], rot[2][2]))
+        return roll, pitch
+
+
+class BatchRunner:
+    """시나리오 생성, 병렬 실행, 결과 저장"""
+
+    @staticmethod
+    def make_scenarios(sizes, densities, drag_coefficients, sea_states,
+                       duration=20.0, dt=1.0 / 60.0, settle_time=5.0,
+                       initial_height=0.5, initial_tilt_deg=5.0, solver_options=None):
+        """물체 x 해상 상태 조합 목록 생성
+
+        sea_states: (amplitude, wavelength, speed, steepness, num_waves) 목록
+        또는 (요약용 파라미터 튜플, SeaStateProfile) 쌍 (시간에 따라 변하는 해상 상태)
+        solver_options: BuoyancySolver.compute_forces 추가 인자 (예: slope_factor)
+        """
+        scenarios = []
+        for index, (size, density, drag, sea_state) in enumerate(
+                itertools.product(sizes, densities, drag_coefficients, sea_states)):
+            profile_given = len(sea_state) == 2
+            scenarios.append({
+                "scenario": index,
+                "size": tuple(float(s) for s in size),
+                "material_density": float(density),
+                "drag_coefficient": float(drag),
+                "wave": tuple(sea_state[0] if profile_given else sea_state),
+                "sea_state": sea_state[1] if profile_given else None,
+                "duration": duration,
+                "dt": dt,
+                "settle_time": settle_time,
+                "initial_height": initial_height,
+                "initial_tilt_deg": initial_tilt_deg,
+                "solver_options": dict(solver_options or {}),
+            })
+        return scenarios
+
+    @staticmethod
+    def run_scenario(scenario, water_density=1000.0, gravity=9.81, angular_drag_coefficient=1.0):
+        """시나리오 하나 실행 후 요약 지표 반환"""
+        start = _time.perf_counter()
+        size = np.array(scenario["size"])
+        half = size / 2.0
+        prototype = BuoyancyPrototype("box", -half, half)
+        samples = prototype.get_samples(prototype.sample_counts(size))
+        volume = prototype.local_volume
+        mass = volume * scenario["material_density"]
+
+        body = RigidBodyIntegrator(size, mass, gravity=gravity)
+        body.position[2] = scenario["initial_height"]
+        tilt = math.radians(scenario["initial_tilt_deg"])
+        body.rotation = np.array([
+            [1.0, 0.0, 0.0],
+            [0.0, math.cos(tilt), math.sin(tilt)],
+            [0.0, -math.sin(tilt), math.cos(tilt)],
+        ])
+
+        amp, wlen, spd, steep, num_waves = scenario["wave"]
+        profile = scenario.get("sea_state")
+        wave = WaveComponents.from_legacy(amp, wlen, spd, steep, num_waves)
+        constants = (water_density, gravity, scenario["drag_coefficient"], angular_drag_coefficient)
+
+        dt = scenario["dt"]
+        num_steps = int(round(scenario["duration"] / dt))
+        settle_steps = int(round(scenario["settle_time"] / dt))
+        heave, rolls, pitches, drafts, ratios = [], [], [], [], []
+
+        for step in range(num_steps):
+            t = step * dt
+            if profile is not None:
+                wave = profile.evaluate(t)
+            matrix = body.matrix()
+            result = BuoyancySolver.compute_forces(
+                [samples], matrix[None], [volume],
+                body.velocity[None], body.angular_velocity[None],
+                t, wave, constants, **scenario.get("solver_options", {})
+            )
+            body.step(result.forces[0], result.torques[0], dt)
+
+            if step >= settle_steps:
+                roll, pitch = body.roll_pitch()
+                heave.append(body.position[2])
+                rolls.append(roll)
+                pitches.append(pitch)
+                # 흘수는 바닥면 중심 깊이 (모서리 최저점은 기울기/롤에 따라 과대평가됨)
+                drafts.append(-float((body.position - half[2] * body.rotation[2])[2]))
+                ratios.append(float(result.submerged_ratio[0]))
+
+        heave = np.array(heave)
+        return {
+            "scenario": scenario["scenario"],
+            "size_x": size[0], "size_y": size[1], "size_z": size[2],
+            "material_density": scenario["material_density"],
+            "drag_coefficient": scenario["drag_coefficient"],
+            "amplitude": amp, "wavelength": wlen, "speed": spd,
+            "steepness": steep, "num_waves": int(num_waves),
+            "heave_rms": float(np.sqrt(np.mean((heave - heave.mean()) ** 2))) if len(heave) else 0.0,
+            "roll_rms_deg": math.degrees(float(np.sqrt(np.mean(np.square(rolls))))) if rolls else 0.0,
+            "pitch_rms_deg": math.degrees(float(np.sqrt(np.mean(np.square(pitches))))) if pitches else 0.0,
+            "equilibrium_draft": float(np.mean(drafts)) if drafts else 0.0,
+            "expected_draft": min(size[2], size[2] * scenario["material_density"] / water_density),
+            "mean_submerged_ratio": float(np.mean(ratios)) if ratios else 0.0,
+            "final_z": float(body.position[2]),
+            "sim_time": scenario["duration"],
+            "wall_time": _time.perf_counter() - start,
+        }
+
+    @staticmethod
+    def run(scenarios, workers=None):
+        """시나리오 병렬 실행 (workers=1이면 현재 프로세스에서 실행)"""
+        if workers == 1:
+            return [BatchRunner.run_scenario(s) for s in scenarios]
+        from concurrent.futures import ProcessPoolExecutor
+
+        workers = workers or os.cpu_count() or 1
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(BatchRunner.run_scenario, scenarios))
+
+    @staticmethod
+    def write_results(rows, path):
+        """결과 저장 (.parquet은 pyarrow/pandas 필요, 그 외는 CSV)"""
+        if path.endswith(".parquet"):
+            try:
+                import pyarrow as pa
+                import pyarrow.parquet as pq
+                table = pa.table({column: [row[column] for row in rows] for column in RESULT_COLUMNS})
+                pq.write_table(table, path)
+                return path
+            except ImportError:
+                pass
+            try:
+                import pandas as pd
+                pd.DataFrame(rows, columns=RESULT_COLUMNS).to_parquet(path)
+                return path
+            except ImportError:
+                path = path[:-len(".parquet")] + ".csv"
+                print(f"Parquet support not installed (pyarrow/pandas), writing CSV: {path}")
+
+        with open(path, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=RESULT_COLUMNS)
+            writer.writeheader()
+            writer.writerows(rows)
+        return path
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Offline buoyancy parameter sweep")
+    parser.add_argument("--sizes", type=float, nargs="+", default=[3.0, 3.0, 0.2],
+                        help="box sizes as flat x y z triples")
+    parser.add_argument("--densities", type=float, nargs="+", default=[50.0, 200.0, 500.0])
+    parser.add_argument("--drag", type=float, nargs="+", default=[1.0])
+    parser.add_argument("--amplitudes", type=float, nargs="+", default=[0.2])
+    parser.add_argument("--wavelengths", type=float, nargs="+", default=[4.0])
+    parser.add_argument("--speeds", type=float, nargs="+", default=[1.5])
+    parser.add_argument("--steepness", type=float, nargs="+", default=[0.2])
+    parser.add_argument("--num-waves", type=int, nargs="+", default=[2])
+    parser.add_argument("--duration", type=float, default=20.0)
+    parser.add_argument("--dt", type=float, default=1.0 / 60.0)
+    parser.add_argument("--settle", type=float, default=5.0)
+    parser.add_argument("--slope-factor", type=float, default=0.0,
+                        help="tilt buoyancy toward the mean surface normal (0-1)")
+    parser.add_argument("--drag-model", choices=["relative", "body"], default="relative",
+                        help="relative: per-sample flow relative to wave orbital velocity, "
+                             "body: single body velocity against still water")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--out", default="buoyancy_sweep.csv")
+    args = parser.parse_args()
+
+    if len(args.sizes) % 3 != 0:
+        parser.error("--sizes needs x y z triples")
+    sizes = [tuple(args.sizes[i:i + 3]) for i in range(0, len(args.sizes), 3)]
+    sea_states = list(itertools.product(args.amplitudes, args.wavelengths, args.speeds,
+                                        args.steepness, args.num_waves))
+
+    scenarios = BatchRunner.make_scenarios(sizes, args.densities, args.drag, sea_states,
+                                           duration=args.duration, dt=args.dt,
+                                           settle_time=args.settle,
+                                           solver_options={"slope_factor": args.slope_factor,
+                                                           "drag_model": args.drag_model})
+    print(f"Running {len(scenarios)} scenarios...")
+    start = _time.perf_counter()
+    rows = BatchRunner.run(scenarios, args.workers)
+    out = BatchRunner.write_results(rows, args.out)
+    print(f"Done in {_time.perf_counter() - start:.1f}s -> {out}")
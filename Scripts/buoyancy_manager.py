@@ -5,46 +5,87 @@ import omni
 import omni.usd
 import omni.kit.app
 import omni.timeline
-from pxr import UsdGeom, Gf, Usd
+import time
+import numpy as np
+from pxr import UsdGeom
 
-import sys
-SCRIPTS_PATH = "/home/rain/isaac_sim_test/Scripts"  # 실제 Scripts 폴더 경로
-if SCRIPTS_PATH not in sys.path:
-    sys.path.insert(0, SCRIPTS_PATH)
-
-
-from buoyant_object import BuoyantObject
-from scene_setup import SceneSetup
-from wave_mesh import WaveMesh
-from buoyancy_physics import BuoyancyPhysics
-from buoyancy_ui import BuoyancyUI
+from .buoyancy_registry import BuoyancyRegistry
+from .buoyancy_prototype import PrototypeLibrary
+from .scene_setup import SceneSetup
+from .wave_mesh import WaveMesh
+from .buoyancy_physics import BuoyancyPhysics
+from .buoyancy_solver import BuoyancySolver
+from .buoyancy_ui import BuoyancyUI
+from .force_writer import ForceWriter
+from .water_body import WaterBody, WaterBodyRegistry
+from .ripple_field import RippleField
+from .wave_field import WaveComponents
 
 
 class BuoyancyManager:
     """부력 시뮬레이션 매니저"""
     
+    DEFAULT_WATER_BODY = "default"
+    # 탱크 크기 슬라이더 입력이 멈춘 뒤 적용까지 대기 시간 [s]
+    TANK_RESIZE_DELAY = 0.25
+    # 월드 스케일이 이 비율 이상 바뀌면 샘플 그리드와 부피 재계산
+    SCALE_TOLERANCE = 1e-4
+    WATER_BODIES_ROOT = "/World/WaterBodies"
+    
     def __init__(self):
         self.time = 0.0
         self.resolution = 20
         self.mesh_path = "/World/GerstnerWave"
         self.tank_path = "/World/WaterTank"
         
-        self.buoyant_objects = {}
+        # prim 경로 -> BuoyantObject (배열 기반, handle 고정)
+        self.buoyant_objects = BuoyancyRegistry()
+        self.prototypes = PrototypeLibrary()
         self.debug_mode = True
         
+        # 힘/토크 일괄 기록 (epsilon 미만 변화는 기록 생략)
+        self.force_epsilon = 1e-3
+        self.force_writer = ForceWriter(self.force_epsilon)
+        
+        # 상태 기록 (start_recording으로 활성화)
+        self.recorder = None
+        
+        # 부력 방향을 수면 법선 쪽으로 기울이는 정도 (0 = 연직)
+        self.slope_factor = 0.0
+        
+        # 항력 모델: "relative" = 샘플별 파도 궤도 속도 기준, "body" = 물체 속도 하나 (저비용)
+        self.drag_model = "relative"
+        
+        # 수역 목록 (기본 수역 = 기존 /World/GerstnerWave + /World/WaterTank)
+        # 물체별 수역 배정은 buoyant_objects.water_body에 캐시
+        self.water_bodies = WaterBodyRegistry()
+        self._water_generation = self.water_bodies.generation
+        
+        # 대기 중인 탱크 크기 변경 (request_water_tank_size, 입력이 멈추면 update에서 적용)
+        self._pending_tank_size = None
+        self._pending_tank_time = 0.0
+        
         stage = omni.usd.get_context().get_stage()
         
-        # 기존 오브젝트 제거
-        if stage.GetPrimAtPath(self.mesh_path):
-            stage.RemovePrim(self.mesh_path)
-        if stage.GetPrimAtPath(self.tank_path):
-            stage.RemovePrim(self.tank_path)
+        # 이전 실행의 추가 수역 제거 (등록 정보가 없으므로)
+        if stage.GetPrimAtPath(self.WATER_BODIES_ROOT):
+            stage.RemovePrim(self.WATER_BODIES_ROOT)
         
-        # 씬 설정
+        # 씬 설정 (스크립트 재실행 시 같은 해상도의 메시와 탱크는 그대로 재사용)
         SceneSetup.setup_physics_scene(stage)
-        WaveMesh.create_wave_mesh(stage, self.mesh_path, self.resolution)
-        SceneSetup.create_water_tank(stage, self.tank_path, 20.0)
+        if WaveMesh.is_wave_mesh(stage, self.mesh_path, self.resolution):
+            # 이전 버전에서 만든 메시도 해석적 법선 설정(leftHanded, 분할 없음)으로 맞춤
+            WaveMesh.configure_normals(UsdGeom.Mesh.Get(stage, self.mesh_path))
+            print(f"Reusing existing wave mesh: {self.mesh_path}")
+        else:
+            if stage.GetPrimAtPath(self.mesh_path):
+                stage.RemovePrim(self.mesh_path)
+            WaveMesh.create_wave_mesh(stage, self.mesh_path, self.resolution)
+        size = stage.GetPrimAtPath(self.mesh_path).GetAttribute("wave:size").Get()
+        SceneSetup.create_water_tank(stage, self.tank_path, size)
         SceneSetup.setup_lighting(stage)
+        self.water_bodies.add(WaterBody(self.DEFAULT_WATER_BODY, size=size, mesh_path=self.mesh_path,
+                                        tank_path=self.tank_path, resolution=self.resolution))
         
         # UI 생성
         self.ui = BuoyancyUI(self)
@@ -58,8 +99,22 @@ class BuoyancyManager:
         print("Physics-Based Buoyancy Manager")
         print("="*60)
     
-    def add_buoyancy_to_object(self, prim_path, material_density=50.0):
-        """물체에 부력 추가"""
+    def shutdown(self):
+        """업데이트 구독, 기록, UI 정리 (스크립트 재실행 전 호출)"""
+        if self.sub is not None:
+            self.sub.unsubscribe()
+            self.sub = None
+        self.stop_recording()
+        if self.ui is not None and self.ui.window is not None:
+            self.ui.window.destroy()
+            self.ui.window = None
+    
+    def add_buoyancy_to_object(self, prim_path, material_density=50.0, prototype_key=None):
+        """물체에 부력 추가
+        
+        prototype_key가 같거나 같은 USD instance prototype을 쓰는 물체는
+        샘플 포인트와 부피 데이터를 공유한다.
+        """
         stage = omni.usd.get_context().get_stage()
         prim = stage.GetPrimAtPath(prim_path)
         
@@ -71,36 +126,31 @@ class BuoyancyManager:
             print(f"Object already has buoyancy: {prim_path}")
             return False
         
-        buoyant_obj = BuoyantObject(prim_path, material_density)
+        # 형상 데이터 (프로토타입 공유)
+        prototype = self.prototypes.acquire(prim, prototype_key)
+        if prototype is None:
+            print(f"  Warning: Could not compute bounding box: {prim_path}")
+            return False
         
-        # 부피 계산
-        bbox_cache = UsdGeom.BBoxCache(Usd.TimeCode.Default(), ['default'])
-        bbox = bbox_cache.ComputeLocalBound(prim)
+        scale = BuoyancyPhysics.get_world_scale(prim)
+        buoyant_obj = self.buoyant_objects.add(prim_path, material_density, prototype, scale)
+        print(f"BuoyantObject registered: {prim_path} (handle {buoyant_obj.handle})")
+        print(f"  Material density: {material_density} kg/m^3")
         
-        if bbox:
-            bbox_range = bbox.GetRange()
-            size = bbox_range.GetMax() - bbox_range.GetMin()
-            
-            scale = BuoyancyPhysics.get_world_scale(prim)
-            size = Gf.Vec3f(size[0] * scale[0], size[1] * scale[1], size[2] * scale[2])
-            
-            volume = abs(size[0] * size[1] * size[2])
-            mass = volume * material_density
-            
-            print(f"  Object size: {size[0]:.2f} x {size[1]:.2f} x {size[2]:.2f} m")
-            print(f"  Volume: {volume:.4f} m^3")
-            print(f"  Mass: {mass:.2f} kg")
-            print(f"  Weight: {mass * 9.81:.2f} N")
-            print(f"  Max buoyancy: {volume * 1000 * 9.81:.2f} N")
-        else:
-            volume = 1.0
-            mass = material_density
-            print("  Warning: Could not compute bounding box")
+        size = prototype.world_size(buoyant_obj.scale)
+        volume = buoyant_obj.volume
+        mass = volume * material_density
+        
+        print(f"  Prototype: {prototype.key} (instances: {prototype.ref_count})")
+        print(f"  Object size: {size[0]:.2f} x {size[1]:.2f} x {size[2]:.2f} m")
+        print(f"  Volume: {volume:.4f} m^3")
+        print(f"  Mass: {mass:.2f} kg")
+        print(f"  Weight: {mass * 9.81:.2f} N")
+        print(f"  Max buoyancy: {volume * 1000 * 9.81:.2f} N")
         
         # 물리 속성 추가
         BuoyancyPhysics.add_physics_to_object(prim, mass)
         
-        self.buoyant_objects[prim_path] = buoyant_obj
         print(f"Buoyancy added successfully to: {prim_path}")
         
         return True
@@ -108,17 +158,121 @@ class BuoyancyManager:
     def remove_buoyancy_from_object(self, prim_path):
         """물체에서 부력 제거"""
         if prim_path in self.buoyant_objects:
-            del self.buoyant_objects[prim_path]
+            self._unregister(prim_path)
             print(f"Buoyancy removed from: {prim_path}")
             return True
         return False
     
+    def _unregister(self, prim_path):
+        """등록 해제 및 공유 데이터 참조 해제"""
+        buoyant_obj = self.buoyant_objects[prim_path]
+        prototype = buoyant_obj.prototype
+        self.buoyant_objects.remove(buoyant_obj.handle)
+        if prototype is not None:
+            self.prototypes.release(prototype)
+        self.force_writer.forget(prim_path)
+    
+    def request_water_tank_size(self, new_size):
+        """탱크 크기 변경 예약 (슬라이더용, 마지막 입력 후 TANK_RESIZE_DELAY가 지나면 적용)"""
+        self._pending_tank_size = float(new_size)
+        self._pending_tank_time = time.monotonic()
+    
+    def _apply_pending_tank_size(self, stage):
+        """예약된 탱크 크기가 안정되면 수면 크기와 탱크에 한 번만 적용"""
+        if self._pending_tank_size is None:
+            return
+        if time.monotonic() - self._pending_tank_time < self.TANK_RESIZE_DELAY:
+            return
+        new_size = self._pending_tank_size
+        self._pending_tank_size = None
+        
+        prim = stage.GetPrimAtPath(self.mesh_path)
+        if prim:
+            prim.GetAttribute("wave:size").Set(new_size)
+        self.update_water_tank_size(new_size)
+    
     def update_water_tank_size(self, new_size):
-        """탱크 크기 업데이트"""
+        """탱크 크기 업데이트 (기존 벽을 제자리에서 갱신)"""
         stage = omni.usd.get_context().get_stage()
         SceneSetup.create_water_tank(stage, self.tank_path, new_size)
+        self._resize_water_body(self.water_bodies.get(self.DEFAULT_WATER_BODY), new_size)
         print(f"Water tank updated to size: {new_size}m")
     
+    def add_water_body(self, name, center, size=20.0, level=0.0, resolution=None,
+                       sea_state=None, priority=0):
+        """수역 추가 (자체 파도 메시, 탱크, 파도 파라미터)
+        
+        영역이 겹치면 priority가 높은 수역이 우선한다.
+        sea_state가 None이면 수역 메시 prim의 wave:* 속성을 사용한다.
+        """
+        if self.water_bodies.get(name) is not None:
+            print(f"Water body already exists: {name}")
+            return None
+        
+        stage = omni.usd.get_context().get_stage()
+        root = f"{self.WATER_BODIES_ROOT}/{name}"
+        UsdGeom.Xform.Define(stage, self.WATER_BODIES_ROOT)
+        UsdGeom.Xform.Define(stage, root)
+        
+        water_body = WaterBody(name, center, size, level,
+                               mesh_path=f"{root}/GerstnerWave", tank_path=f"{root}/WaterTank",
+                               resolution=resolution or self.resolution,
+                               sea_state=sea_state, priority=priority)
+        WaveMesh.create_wave_mesh(stage, water_body.mesh_path, water_body.resolution)
+        stage.GetPrimAtPath(water_body.mesh_path).GetAttribute("wave:size").Set(water_body.size)
+        SceneSetup.create_water_tank(stage, water_body.tank_path, water_body.size,
+                                     water_body.center, water_body.level)
+        self.water_bodies.add(water_body)
+        print(f"Water body added: {name} at ({water_body.center[0]:.1f}, {water_body.center[1]:.1f}), "
+              f"{water_body.size}m, level {water_body.level}m")
+        return water_body
+    
+    def remove_water_body(self, name):
+        """수역 제거 (기본 수역은 제거 불가)"""
+        if name == self.DEFAULT_WATER_BODY:
+            print("The default water body cannot be removed")
+            return False
+        water_body = self.water_bodies.remove(name)
+        if water_body is None:
+            return False
+        stage = omni.usd.get_context().get_stage()
+        root = f"{self.WATER_BODIES_ROOT}/{name}"
+        if stage.GetPrimAtPath(root):
+            stage.RemovePrim(root)
+        print(f"Water body removed: {name}")
+        return True
+    
+    def _resize_water_body(self, water_body, size):
+        """수역 영역 크기 변경 (공간 색인 재구성)"""
+        if water_body is None or water_body.size == float(size):
+            return
+        water_body.size = float(size)
+        self.water_bodies.rebuild_index()
+        if water_body.ripple is not None:
+            water_body.ripple.resize(water_body.center, water_body.size)
+    
+    def enable_ripples(self, water_body=None, resolution=64, **options):
+        """수역에 잔물결/항적 층 추가 (물체가 만든 변위를 수면과 부력에 반영)
+        
+        resolution: 격자 한 변의 점 개수 (프레임당 비용은 resolution^2에 비례)
+        options: RippleField 인자 (wave_speed, damping, restoring, coupling, max_height)
+        """
+        target = self.water_bodies.get(water_body or self.DEFAULT_WATER_BODY)
+        if target is None:
+            print(f"Water body not found: {water_body}")
+            return None
+        target.ripple = RippleField(target.center, target.size, resolution, **options)
+        print(f"Ripples enabled on {target.name}: {resolution} x {resolution} grid, "
+              f"{target.ripple.cell:.2f}m cells")
+        return target.ripple
+    
+    def disable_ripples(self, water_body=None):
+        """수역의 잔물결 층 제거"""
+        target = self.water_bodies.get(water_body or self.DEFAULT_WATER_BODY)
+        if target is not None and target.ripple is not None:
+            target.ripple = None
+            print(f"Ripples disabled on {target.name}")
+    
     def rebuild_wave_mesh(self, stage):
         """Wave Mesh 재생성"""
         prim = stage.GetPrimAtPath(self.mesh_path)
@@ -171,6 +325,161 @@ class BuoyancyManager:
             current = prim.GetAttribute("wave:paused").Get()
             prim.GetAttribute("wave:paused").Set(not current)
     
+    def apply_buoyancy(self, stage, waves):
+        """모든 물체의 부력을 수역별로 묶어 계산하고 기록
+        
+        waves: 수역 순서(self.water_bodies)와 같은 WaveComponents 목록
+        """
+        registry = self.buoyant_objects
+        handles, matrices, velocities, angular_velocities, missing_paths = \
+            BuoyancyPhysics.read_body_states(stage, registry)
+        
+        for prim_path in missing_paths:
+            print(f"Object removed from scene: {prim_path}")
+            self._unregister(prim_path)
+        
+        slots = np.array([registry.slot(int(h)) for h in handles], dtype=np.int64)
+        self._refresh_scales(handles, slots, matrices)
+        samples = [registry.samples[slot] for slot in slots]
+        volumes = registry.volume[slots]
+        constants = (registry.water_density, registry.gravity,
+                     registry.drag_coefficient, registry.angular_drag_coefficient)
+        
+        # 수역 배정 (이전 수역 영역 안에 있으면 재사용, 수역 목록이 바뀌면 전부 다시 조회)
+        if self._water_generation != self.water_bodies.generation:
+            registry.water_body[:registry.count] = -1
+            self._water_generation = self.water_bodies.generation
+        assignment = self.water_bodies.assign(registry.water_body[slots], matrices[:, 3, :2])
+        registry.water_body[slots] = assignment
+        
+        # 수역 밖 물체는 힘 0
+        forces = np.zeros((len(slots), 3))
+        torques = np.zeros((len(slots), 3))
+        ratios = np.zeros(len(slots))
+        options = self.solver_options()
+        if self.recorder is not None:
+            self.recorder.define_bodies(registry, handles)
+        
+        for index in np.unique(assignment[assignment >= 0]):
+            group = np.flatnonzero(assignment == index)
+            wave = waves[index]
+            if self.water_bodies.water_bodies[index].ripple is not None:
+                # 잔물결 층에서 각 물체 자신의 변위는 뺌
+                wave = wave.for_bodies(handles[group])
+            # 수면 기준 높이만큼 내린 좌표로 계산 (높이 외에는 수평 이동에 무관)
+            group_matrices = matrices[group]
+            level = self.water_bodies.water_bodies[index].level
+            if level:
+                group_matrices = group_matrices.copy()
+                group_matrices[:, 3, 2] -= level
+            
+            result = BuoyancySolver.compute_forces(
+                [samples[i] for i in group], group_matrices, volumes[group],
+                velocities[group], angular_velocities[group],
+                self.time, wave, constants, **options
+            )
+            forces[group] = result.forces
+            torques[group] = result.torques
+            ratios[group] = result.submerged_ratio
+            
+            if self.recorder is not None:
+                self.recorder.record_step(self.time, wave, handles[group], group_matrices,
+                                          velocities[group], angular_velocities[group],
+                                          result.forces, result.torques)
+        
+        # 잔물결 층에 물체 변위 기록 후 진행 (잠긴 부피, 수역을 떠난 물체는 빈 배정으로 제거됨)
+        # 변위 기록과 같은 프레임에만 진행해야 물체별 자기 잔물결 이력이 격자와 맞음
+        for index, water_body in enumerate(self.water_bodies):
+            if water_body.ripple is not None:
+                group = np.flatnonzero(assignment == index)
+                water_body.ripple.displace(handles[group], matrices[group, 3, 0], matrices[group, 3, 1],
+                                           volumes[group] * ratios[group], self._footprint_radii(slots[group]))
+                water_body.ripple.step(1/60.0)
+        
+        # 힘/토크 일괄 기록
+        for slot, force, torque in zip(slots, forces, torques):
+            self.force_writer.queue(registry.prim_paths[slot], force, torque)
+        self.force_writer.epsilon = self.force_epsilon
+        self.force_writer.flush(stage)
+        
+        # 디버그 출력 후 비활성화
+        if self.debug_mode:
+            for slot, ratio, index in zip(slots, ratios, assignment):
+                prototype = registry.prototypes[slot]
+                water_name = self.water_bodies.water_bodies[index].name if index >= 0 else "(none)"
+                print(f"\n{registry.prim_paths[slot]} (handle {registry.handles[slot]}):")
+                print(f"  Water body: {water_name}")
+                print(f"  Prototype: {prototype.key} (shared by {prototype.ref_count})")
+                print(f"  Sample points: {len(registry.samples[slot])}, submerged: {ratio * 100:.1f}%")
+            writer = self.force_writer
+            print(f"Force write: {writer.last_write_count} written, "
+                  f"{writer.last_skip_count} skipped, "
+                  f"{writer.last_write_time * 1000:.3f} ms")
+            self.debug_mode = False
+    
+    def _refresh_scales(self, handles, slots, matrices):
+        """등록 후 스케일이 바뀐 물체의 샘플/부피 갱신 (변환 행렬의 행 길이 = 축별 월드 스케일)"""
+        registry = self.buoyant_objects
+        if len(slots) == 0:
+            return
+        scales = np.linalg.norm(matrices[:, :3, :3], axis=2)
+        current = registry.scale[slots]
+        changed = np.any(np.abs(scales - current) > self.SCALE_TOLERANCE * np.maximum(np.abs(current), 1e-9),
+                         axis=1)
+        for i in np.flatnonzero(changed):
+            registry.set_scale(int(handles[i]), scales[i])
+            if self.debug_mode:
+                print(f"Scale changed: {registry.prim_paths[slots[i]]} -> "
+                      f"{scales[i][0]:.3f} x {scales[i][1]:.3f} x {scales[i][2]:.3f}")
+
+    def _footprint_radii(self, slots):
+        """잔물결 층에 변위를 퍼뜨릴 바닥 반경 (수평 면적이 같은 정사각형의 반변, 프로토타입 없으면 0)"""
+        registry = self.buoyant_objects
+        radii = np.zeros(len(slots))
+        for i, slot in enumerate(slots):
+            prototype = registry.prototypes[slot]
+            if prototype is not None:
+                size = prototype.world_size(registry.scale[slot])
+                radii[i] = 0.5 * np.sqrt(abs(size[0] * size[1]))
+        return radii
+
+    def set_sea_state(self, profile, water_body=None):
+        """해상 상태 프로파일 설정 (SeaStateProfile, None이면 wave:* 속성으로 복귀)
+        
+        water_body: 수역 이름 (None이면 기본 수역)
+        """
+        target = self.water_bodies.get(water_body or self.DEFAULT_WATER_BODY)
+        if target is None:
+            print(f"Water body not found: {water_body}")
+            return
+        target.sea_state = profile
+        if profile is not None:
+            print(f"Sea state profile set on {target.name}: {profile.num_components} wave components")
+        else:
+            print(f"Sea state profile cleared on {target.name}")
+    
+    def solver_options(self):
+        """BuoyancySolver.compute_forces 추가 인자"""
+        return {"slope_factor": self.slope_factor, "drag_model": self.drag_model}
+    
+    def start_recording(self, path, chunk_steps=256):
+        """파도/부력 상태 기록 시작 (BuoyancyReplay로 헤드리스 재생 가능)"""
+        from .buoyancy_recorder import BuoyancyRecorder
+        
+        self.stop_recording()
+        constants = (self.buoyant_objects.water_density, self.buoyant_objects.gravity,
+                     self.buoyant_objects.drag_coefficient,
+                     self.buoyant_objects.angular_drag_coefficient)
+        self.recorder = BuoyancyRecorder(path, constants, chunk_steps, self.solver_options())
+        if any(water_body.ripple is not None for water_body in self.water_bodies):
+            print("Warning: ripple layers are not recorded, replay will use the Gerstner surface only")
+    
+    def stop_recording(self):
+        """기록 종료"""
+        if self.recorder is not None:
+            self.recorder.close()
+            self.recorder = None
+    
     def update(self, e):
         """매 프레임 업데이트"""
         try:
@@ -180,44 +489,47 @@ class BuoyancyManager:
             if not prim or not prim.IsValid():
                 return
             
-            # Wave 속성 가져오기
-            amp = prim.GetAttribute("wave:amplitude").Get()
-            wlen = prim.GetAttribute("wave:wavelength").Get()
-            spd = prim.GetAttribute("wave:speed").Get()
-            steep = prim.GetAttribute("wave:steepness").Get()
-            size = prim.GetAttribute("wave:size").Get()
+            # 일시정지 중에도 탱크 크기 변경은 적용
+            self._apply_pending_tank_size(stage)
+            
+            # 기본 수역의 일시정지가 전체 시간을 멈춤
             pause = prim.GetAttribute("wave:paused").Get()
-            num_waves = prim.GetAttribute("wave:num_waves").Get()
             
             if pause:
                 return
             
             self.time += 1/60.0
             
-            # Wave mesh 업데이트
-            WaveMesh.update_wave_mesh(stage, self.mesh_path, self.resolution, self.time,
-                                     amp, wlen, spd, steep, size, num_waves)
+            # 수역별 파 성분 (해상 상태 프로파일이 있으면 프레임당 한 번 평가) 및 메시 업데이트
+            waves = []
+            for water_body in self.water_bodies:
+                wave_prim = stage.GetPrimAtPath(water_body.mesh_path)
+                if not wave_prim or not wave_prim.IsValid():
+                    waves.append(water_body.sea_state.evaluate(self.time) if water_body.sea_state
+                                 else WaveComponents([], [], [], [], np.zeros((0, 2))))
+                    continue
+                
+                if water_body.sea_state is not None:
+                    wave = water_body.sea_state.evaluate(self.time)
+                else:
+                    wave = WaveMesh.get_wave_components(wave_prim, water_body.mesh_cache)
+                # 잔물결 층은 메시와 부력 높이 조회 모두에 더해짐
+                if water_body.ripple is not None:
+                    wave = water_body.ripple.compose(wave)
+                waves.append(wave)
+                
+                size = wave_prim.GetAttribute("wave:size").Get()
+                self._resize_water_body(water_body, size)
+                resolution = self.resolution if water_body.name == self.DEFAULT_WATER_BODY \
+                    else water_body.resolution
+                WaveMesh.update_wave_mesh(stage, water_body.mesh_path, resolution, self.time, wave,
+                                          size, center=water_body.center, level=water_body.level,
+                                          cache=water_body.mesh_cache)
             
             # 부력 적용
             timeline = omni.timeline.get_timeline_interface()
             if timeline.is_playing():
-                for prim_path, buoyant_obj in list(self.buoyant_objects.items()):
-                    if not buoyant_obj.is_active:
-                        continue
-                    
-                    success = BuoyancyPhysics.apply_buoyancy_force(
-                        stage, buoyant_obj, self.time,
-                        amp, wlen, spd, steep, num_waves,
-                        self.debug_mode
-                    )
-                    
-                    if not success:
-                        print(f"Object removed from scene: {prim_path}")
-                        del self.buoyant_objects[prim_path]
-                
-                # 디버그 모드 비활성화
-                if self.debug_mode:
-                    self.debug_mode = False
+                self.apply_buoyancy(stage, waves)
             
         except Exception as ex:
             import traceback
@@ -0,0 +1,107 @@
+"""
+부력 프로토타입 - 같은 에셋을 공유하는 물체들의 형상 데이터 공유
+"""
+import numpy as np
+
+
+class BuoyancyPrototype:
+    """여러 인스턴스가 공유하는 불변 로컬 샘플/부피 데이터"""
+
+    # 샘플 그리드 규칙 (축 크기에 비례, 최소 3개, 최대 10개)
+    BASE_SAMPLES = 3
+    MAX_SAMPLES = 10
+    SAMPLE_DENSITY = 0.5  # 1m당 샘플 개수
+
+    def __init__(self, key, local_min, local_max):
+        self.key = key
+        self.local_min = self._readonly(np.array(local_min, dtype=np.float64))
+        self.local_max = self._readonly(np.array(local_max, dtype=np.float64))
+        self.local_size = self._readonly(self.local_max - self.local_min)
+        self.local_volume = float(abs(np.prod(self.local_size)))
+        self.ref_count = 0
+
+        # (nx, ny, nz) -> 로컬 샘플 포인트 배열
+        self._sample_grids = {}
+
+    @staticmethod
+    def _readonly(array):
+        """공유 배열을 읽기 전용으로 고정"""
+        array.flags.writeable = False
+        return array
+
+    @classmethod
+    def sample_counts(cls, world_size):
+        """월드 크기에 따른 축별 샘플 개수"""
+        return tuple(
+            max(cls.BASE_SAMPLES, min(cls.MAX_SAMPLES, int(s * cls.SAMPLE_DENSITY) + cls.BASE_SAMPLES))
+            for s in world_size
+        )
+
+    def world_size(self, scale):
+        """스케일 적용된 크기"""
+        return self.local_size * np.asarray(scale, dtype=np.float64)
+
+    def volume(self, scale):
+        """스케일 적용된 부피"""
+        return self.local_volume * float(abs(np.prod(scale)))
+
+    def get_samples(self, counts):
+        """축별 샘플 개수에 해당하는 로컬 샘플 포인트 (N x 3, 공유)"""
+        samples = self._sample_grids.get(counts)
+        if samples is not None:
+            return samples
+
+        axes = []
+        for axis, n in enumerate(counts):
+            t = np.linspace(0.0, 1.0, n) if n > 1 else np.array([0.5])
+            axes.append(self.local_min[axis] + self.local_size[axis] * t)
+
+        grid = np.meshgrid(axes[0], axes[1], axes[2], indexing="ij")
+        samples = self._readonly(np.stack([g.ravel() for g in grid], axis=1))
+        self._sample_grids[counts] = samples
+        return samples
+
+
+class PrototypeLibrary:
+    """프로토타입 키 -> BuoyancyPrototype 캐시"""
+
+    def __init__(self):
+        self.prototypes = {}
+
+    @staticmethod
+    def get_prototype_key(prim, key=None):
+        """프로토타입 키 결정 (사용자 키 > USD instance prototype > prim 경로)"""
+        if key:
+            return key
+        if prim.IsInstance():
+            prototype = prim.GetPrototype()
+            if prototype:
+                return str(prototype.GetPath())
+        return str(prim.GetPath())
+
+    def acquire(self, prim, key=None):
+        """프로토타입 조회, 없으면 bounding box로 생성"""
+        key = self.get_prototype_key(prim, key)
+        prototype = self.prototypes.get(key)
+
+        if prototype is None:
+            # pxr는 USD prim에서 생성할 때만 필요 (헤드리스 사용 시 불필요)
+            from pxr import UsdGeom, Usd
+            bbox_cache = UsdGeom.BBoxCache(Usd.TimeCode.Default(), ['default'])
+            bbox = bbox_cache.ComputeLocalBound(prim)
+            if not bbox:
+                return None
+            bbox_range = bbox.GetRange()
+            if bbox_range.IsEmpty():
+                return None
+            prototype = BuoyancyPrototype(key, bbox_range.GetMin(), bbox_range.GetMax())
+            self.prototypes[key] = prototype
+
+        prototype.ref_count += 1
+        return prototype
+
+    def release(self, prototype):
+        """인스턴스 제거 시 참조 해제, 사용하지 않는 프로토타입 삭제"""
+        prototype.ref_count -= 1
+        if prototype.ref_count <= 0:
+            self.prototypes.pop(prototype.key, None)
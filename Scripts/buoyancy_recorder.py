@@ -0,0 +1,303 @@
+"""
+파도/부력 상태 기록 및 재생 (numpy 전용, Isaac Sim 불필요)
+
+로그 파일 구조 (little-endian, 모든 배열은 8바이트 정렬):
+    MAGIC | version(u4) | header_len(u4) | JSON header (8바이트 패딩)
+    chunk* : tag(4s) | count(u4) | payload_len(u8) | payload
+
+    BODY chunk: 물체 정의 (JSON 메타 + 로컬 샘플 float64)
+    STEP chunk: count개 스텝의 시간, 파 성분 배열, 물체 변환/속도, 계산된 힘/토크
+
+사용법 (헤드리스 재생):
+    python -m Scripts.buoyancy_recorder replay <log> [--profile]
+"""
+import json
+import struct
+import time as _time
+
+import numpy as np
+
+from .buoyancy_solver import BuoyancySolver
+from .wave_field import WaveComponents
+
+
+MAGIC = b"BUOYLOG\x00"
+VERSION = 2
+FILE_HEADER = struct.Struct("<8sII")
+CHUNK_HEADER = struct.Struct("<4sIQ")
+TAG_BODY = b"BODY"
+TAG_STEP = b"STEP"
+
+
+def _pad8(data):
+    """8바이트 정렬 패딩"""
+    return data + b"\x00" * (-len(data) % 8)
+
+
+class BuoyancyRecorder:
+    """스텝별 입력과 계산 결과를 청크 단위 바이너리 로그로 기록"""
+
+    def __init__(self, path, constants, chunk_steps=256, solver_options=None):
+        self.path = path
+        self.chunk_steps = chunk_steps
+        self.num_steps = 0
+
+        self._file = open(path, "wb")
+        header = _pad8(json.dumps({
+            "version": VERSION,
+            "constants": list(constants),
+            "solver_options": dict(solver_options or {}),
+        }).encode("utf-8"))
+        self._file.write(FILE_HEADER.pack(MAGIC, VERSION, len(header)))
+        self._file.write(header)
+
+        self._bodies = {}  # handle -> (volume, id(samples))
+        self._pending = []
+
+        print(f"Recording buoyancy log: {path}")
+
+    def define_body(self, handle, prim_path, material_density, volume, samples):
+        """물체 정의 기록 (새 물체이거나 형상/부피가 바뀐 경우에만)"""
+        key = (float(volume), id(samples))
+        if self._bodies.get(handle) == key:
+            return
+        # 이전 스텝들은 이전 정의를 사용해야 하므로 먼저 기록
+        self._flush_steps()
+
+        samples_f8 = np.ascontiguousarray(samples, dtype=np.float64)
+        meta = _pad8(json.dumps({
+            "handle": int(handle),
+            "prim_path": prim_path,
+            "material_density": float(material_density),
+            "volume": float(volume),
+            "num_samples": len(samples_f8),
+        }).encode("utf-8"))
+        payload = struct.pack("<I", len(meta)) + b"\x00" * 4 + meta + samples_f8.tobytes()
+        self._file.write(CHUNK_HEADER.pack(TAG_BODY, 1, len(payload)))
+        self._file.write(payload)
+        self._bodies[handle] = key
+
+    def define_bodies(self, registry, handles):
+        """레지스트리에 등록된 물체들의 정의 기록"""
+        for handle in handles:
+            slot = registry.slot(int(handle))
+            self.define_body(int(handle), registry.prim_paths[slot], registry.material_density[slot],
+                             registry.volume[slot], registry.samples[slot])
+
+    def record_step(self, time, wave, handles, matrices, velocities, angular_velocities, forces, torques):
+        """한 스텝 기록 (chunk_steps개가 모이면 파일에 기록)"""
+        self._pending.append((
+            float(time),
+            wave.to_array(),
+            np.asarray(handles, dtype=np.int64),
+            np.asarray(matrices, dtype=np.float64).reshape(-1, 4, 4),
+            np.asarray(velocities, dtype=np.float64).reshape(-1, 3),
+            np.asarray(angular_velocities, dtype=np.float64).reshape(-1, 3),
+            np.asarray(forces, dtype=np.float64).reshape(-1, 3),
+            np.asarray(torques, dtype=np.float64).reshape(-1, 3),
+        ))
+        self.num_steps += 1
+        if len(self._pending) >= self.chunk_steps:
+            self._flush_steps()
+
+    def _flush_steps(self):
+        """대기 중인 스텝을 하나의 STEP chunk로 기록"""
+        if not self._pending:
+            return
+        steps = self._pending
+        self._pending = []
+
+        arrays = [
+            np.array([s[0] for s in steps], dtype=np.float64),
+            np.array([len(s[2]) for s in steps], dtype=np.int64),
+            np.array([len(s[1]) for s in steps], dtype=np.int64),
+            np.concatenate([s[1] for s in steps]),
+        ]
+        for field in range(2, 8):
+            arrays.append(np.concatenate([s[field] for s in steps], axis=0))
+
+        payload = b"".join(np.ascontiguousarray(a).tobytes() for a in arrays)
+        self._file.write(CHUNK_HEADER.pack(TAG_STEP, len(steps), len(payload)))
+        self._file.write(payload)
+
+    def flush(self):
+        """대기 중인 데이터를 파일에 기록"""
+        self._flush_steps()
+        self._file.flush()
+
+    def close(self):
+        """기록 종료"""
+        if self._file.closed:
+            return
+        self.flush()
+        self._file.close()
+        print(f"Buoyancy log closed: {self.path} ({self.num_steps} steps)")
+
+
+class BuoyancyLog:
+    """memory-map 기반 로그 읽기 (스텝 배열은 파일을 복사하지 않는 view)"""
+
+    def __init__(self, path):
+        self.path = path
+        self._data = np.memmap(path, dtype=np.uint8, mode="r")
+
+        magic, version, header_len = FILE_HEADER.unpack_from(self._data, 0)
+        if magic != MAGIC:
+            raise ValueError(f"Not a buoyancy log: {path}")
+        if version != VERSION:
+            raise ValueError(f"Unsupported buoyancy log version: {version}")
+
+        offset = FILE_HEADER.size
+        header = json.loads(bytes(self._data[offset:offset + header_len]).rstrip(b"\x00"))
+        self.constants = tuple(header["constants"])
+        self.solver_options = header.get("solver_options", {})
+        offset += header_len
+
+        # (tag, 이 chunk 이전까지의 스텝 수, chunk 데이터)
+        self.chunks = []
+        self.num_steps = 0
+        while offset + CHUNK_HEADER.size <= len(self._data):
+            tag, count, payload_len = CHUNK_HEADER.unpack_from(self._data, offset)
+            offset += CHUNK_HEADER.size
+            if offset + payload_len > len(self._data):
+                break  # 기록 도중 중단된 마지막 chunk
+            if tag == TAG_BODY:
+                self.chunks.append((tag, self.num_steps, self._read_body(offset)))
+            elif tag == TAG_STEP:
+                self.chunks.append((tag, self.num_steps, self._read_steps(offset, count)))
+                self.num_steps += count
+            offset += payload_len
+
+    def _view(self, dtype, count, offset):
+        return np.frombuffer(self._data, dtype=dtype, count=count, offset=offset)
+
+    def _read_body(self, offset):
+        (meta_len,) = struct.unpack_from("<I", self._data, offset)
+        offset += 8
+        meta = json.loads(bytes(self._data[offset:offset + meta_len]).rstrip(b"\x00"))
+        offset += meta_len
+        meta["samples"] = self._view(np.float64, meta["num_samples"] * 3, offset).reshape(-1, 3)
+        return meta
+
+    def _read_steps(self, offset, count):
+        times = self._view(np.float64, count, offset)
+        offset += count * 8
+        body_counts = self._view(np.int64, count, offset)
+        offset += count * 8
+        wave_sizes = self._view(np.int64, count, offset)
+        offset += count * 8
+        wave_values = self._view(np.float64, int(wave_sizes.sum()), offset)
+        offset += wave_values.nbytes
+
+        total = int(body_counts.sum())
+        fields = {}
+        for name, width in (("handles", 1), ("matrices", 16), ("velocities", 3),
+                            ("angular_velocities", 3), ("forces", 3), ("torques", 3)):
+            dtype = np.int64 if name == "handles" else np.float64
+            array = self._view(dtype, total * width, offset)
+            offset += array.nbytes
+            fields[name] = array if width == 1 else array.reshape(total, width)
+        fields["matrices"] = fields["matrices"].reshape(total, 4, 4)
+
+        return {
+            "times": times,
+            "body_offsets": np.concatenate([[0], np.cumsum(body_counts)]),
+            "wave_offsets": np.concatenate([[0], np.cumsum(wave_sizes)]),
+            "wave_values": wave_values,
+            **fields,
+        }
+
+    def iter_steps(self):
+        """스텝 순서대로 (bodies, time, wave, 물체 배열들) 반환
+
+        bodies는 해당 스텝 시점의 handle -> 물체 정의 dict
+        """
+        bodies = {}
+        for tag, _, chunk in self.chunks:
+            if tag == TAG_BODY:
+                bodies[chunk["handle"]] = chunk
+                continue
+            for i in range(len(chunk["times"])):
+                b0, b1 = chunk["body_offsets"][i], chunk["body_offsets"][i + 1]
+                w0, w1 = chunk["wave_offsets"][i], chunk["wave_offsets"][i + 1]
+                yield bodies, {
+                    "time": float(chunk["times"][i]),
+                    "wave": WaveComponents.from_array(chunk["wave_values"][w0:w1]),
+                    "handles": chunk["handles"][b0:b1],
+                    "matrices": chunk["matrices"][b0:b1],
+                    "velocities": chunk["velocities"][b0:b1],
+                    "angular_velocities": chunk["angular_velocities"][b0:b1],
+                    "forces": chunk["forces"][b0:b1],
+                    "torques": chunk["torques"][b0:b1],
+                }
+
+
+class BuoyancyReplay:
+    """기록된 입력을 solver에 다시 넣어 결과를 비교"""
+
+    @staticmethod
+    def run(log_path, solver=BuoyancySolver.compute_forces, verbose=True):
+        """재생 후 비교 결과 반환 (bit 단위 일치 여부 포함)"""
+        log = BuoyancyLog(log_path)
+        mismatched_steps = 0
+        max_error = 0.0
+        solve_time = 0.0
+
+        for bodies, step in log.iter_steps():
+            handles = step["handles"]
+            samples = [bodies[int(h)]["samples"] for h in handles]
+            volumes = np.array([bodies[int(h)]["volume"] for h in handles], dtype=np.float64)
+
+            start = _time.perf_counter()
+            result = solver(
+                samples, step["matrices"], volumes,
+                step["velocities"], step["angular_velocities"],
+                step["time"], step["wave"], log.constants,
+                **log.solver_options
+            )
+            forces, torques = result.forces, result.torques
+            solve_time += _time.perf_counter() - start
+
+            if not (np.array_equal(forces, step["forces"]) and np.array_equal(torques, step["torques"])):
+                mismatched_steps += 1
+                if len(handles):
+                    max_error = max(max_error,
+                                    float(np.abs(forces - step["forces"]).max()),
+                                    float(np.abs(torques - step["torques"]).max()))
+
+        report = {
+            "steps": log.num_steps,
+            "mismatched_steps": mismatched_steps,
+            "bit_exact": mismatched_steps == 0,
+            "max_abs_error": max_error,
+            "solve_time": solve_time,
+        }
+        if verbose:
+            print(f"Replay: {log_path}")
+            print(f"  Steps: {report['steps']}")
+            print(f"  Bit-exact: {report['bit_exact']} "
+                  f"(mismatched {mismatched_steps}, max error {max_error:.3e})")
+            print(f"  Solver time: {solve_time * 1000:.2f} ms "
+                  f"({solve_time * 1e6 / max(1, log.num_steps):.1f} us/step)")
+        return report
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Buoyancy log tools")
+    sub = parser.add_subparsers(dest="command", required=True)
+    replay_parser = sub.add_parser("replay", help="replay a log through the solver")
+    replay_parser.add_argument("log")
+    replay_parser.add_argument("--profile", action="store_true", help="run under cProfile")
+    args = parser.parse_args()
+
+    if args.command == "replay":
+        if args.profile:
+            import cProfile
+            import pstats
+            profiler = cProfile.Profile()
+            profiler.runcall(BuoyancyReplay.run, args.log)
+            pstats.Stats(profiler).sort_stats("cumulative").print_stats(20)
+        else:
+            BuoyancyReplay.run(args.log)
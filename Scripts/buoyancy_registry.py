@@ -0,0 +1,145 @@
+"""
+연속 배열 기반 부력 물체 레지스트리
+"""
+from collections.abc import Mapping
+
+import numpy as np
+
+from .buoyant_object import BuoyantObject
+
+
+class BuoyancyRegistry(Mapping):
+    """물체별 데이터를 타입 배열에 보관하는 레지스트리
+
+    - 물체마다 고정된 정수 handle을 부여 (삭제 전까지 불변)
+    - 배열 slot은 swap-remove로 O(1) 삭제 (slot 순서는 바뀔 수 있음)
+    - 물리 상수는 레지스트리에 한 번만 저장
+    - prim 경로 -> BuoyantObject view 매핑으로 기존 dict API와 호환
+    """
+
+    def __init__(self, capacity=16):
+        # 물리 상수 (모든 물체 공통)
+        self.water_density = 1000.0
+        self.gravity = 9.81
+        self.drag_coefficient = 1.0
+        self.angular_drag_coefficient = 1.0
+
+        self.count = 0
+        self._capacity = 0
+
+        # slot별 데이터 (앞쪽 count개가 유효)
+        self.handles = np.zeros(0, dtype=np.int64)
+        self.material_density = np.zeros(0, dtype=np.float64)
+        self.is_active = np.zeros(0, dtype=bool)
+        self.volume = np.zeros(0, dtype=np.float64)
+        self.scale = np.zeros((0, 3), dtype=np.float64)
+        self.water_body = np.zeros(0, dtype=np.int64)  # 배정된 수역 index (-1 = 미배정)
+        self.prim_paths = []
+        self.prototypes = []
+        self.samples = []
+
+        self._slot_of_handle = {}
+        self._handle_of_path = {}
+        self._next_handle = 0
+
+        self._reserve(capacity)
+
+    def _reserve(self, capacity):
+        """배열 용량 확보 (2배씩 증가)"""
+        if capacity <= self._capacity:
+            return
+        new_capacity = max(capacity, self._capacity * 2)
+        for name in ("handles", "material_density", "is_active", "volume", "scale", "water_body"):
+            old = getattr(self, name)
+            new = np.zeros((new_capacity,) + old.shape[1:], dtype=old.dtype)
+            new[:self.count] = old[:self.count]
+            setattr(self, name, new)
+        self._capacity = new_capacity
+
+    def add(self, prim_path, material_density=50.0, prototype=None, scale=(1.0, 1.0, 1.0)):
+        """물체 등록, BuoyantObject view 반환"""
+        if prim_path in self._handle_of_path:
+            raise KeyError(f"Already registered: {prim_path}")
+
+        self._reserve(self.count + 1)
+        slot = self.count
+        handle = self._next_handle
+        self._next_handle += 1
+
+        self.handles[slot] = handle
+        self.material_density[slot] = material_density
+        self.is_active[slot] = True
+        self.water_body[slot] = -1
+        self.prim_paths.append(prim_path)
+        self.prototypes.append(prototype)
+        self.samples.append(None)
+        self.count += 1
+
+        self._slot_of_handle[handle] = slot
+        self._handle_of_path[prim_path] = handle
+
+        self.set_scale(handle, scale)
+        return BuoyantObject.from_handle(self, handle)
+
+    def remove(self, handle):
+        """handle로 물체 제거 (마지막 slot과 교환 후 삭제), prim 경로 반환"""
+        slot = self._slot_of_handle.pop(handle)
+        last = self.count - 1
+        prim_path = self.prim_paths[slot]
+
+        if slot != last:
+            moved_handle = int(self.handles[last])
+            for array in (self.handles, self.material_density, self.is_active, self.volume, self.scale,
+                          self.water_body):
+                array[slot] = array[last]
+            for items in (self.prim_paths, self.prototypes, self.samples):
+                items[slot] = items[last]
+            self._slot_of_handle[moved_handle] = slot
+
+        for items in (self.prim_paths, self.prototypes, self.samples):
+            items.pop()
+        self.count -= 1
+
+        del self._handle_of_path[prim_path]
+        return prim_path
+
+    def slot(self, handle):
+        """handle -> 현재 배열 slot"""
+        return self._slot_of_handle[handle]
+
+    def handle_of(self, prim_path):
+        """prim 경로 -> handle"""
+        return self._handle_of_path[prim_path]
+
+    def has_handle(self, handle):
+        """handle이 아직 등록되어 있는지 확인"""
+        return handle in self._slot_of_handle
+
+    def set_scale(self, handle, scale):
+        """월드 스케일 갱신 (샘플 그리드와 부피 재선택)"""
+        slot = self._slot_of_handle[handle]
+        self.scale[slot] = scale
+        prototype = self.prototypes[slot]
+        if prototype is None:
+            self.samples[slot] = None
+            self.volume[slot] = 1.0
+            return
+        counts = prototype.sample_counts(prototype.world_size(self.scale[slot]))
+        self.samples[slot] = prototype.get_samples(counts)
+        self.volume[slot] = prototype.volume(self.scale[slot])
+
+    # Mapping (prim 경로 -> view)
+    def __getitem__(self, prim_path):
+        return BuoyantObject.from_handle(self, self._handle_of_path[prim_path])
+
+    def __delitem__(self, prim_path):
+        self.remove(self._handle_of_path[prim_path])
+
+    def __contains__(self, prim_path):
+        return prim_path in self._handle_of_path
+
+    def __iter__(self):
+        return iter(list(self.prim_paths))
+
+    def __len__(self):
+        return self.count
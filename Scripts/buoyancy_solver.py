@@ -0,0 +1,191 @@
+"""
+부력 계산 코어 (numpy 전용, omni/pxr 불필요)
+"""
+import numpy as np
+
+
+class BuoyancyResult:
+    """compute_forces 결과 (물체 순서는 입력과 동일)"""
+
+    def __init__(self, forces, torques, submerged_ratio, surface_normals=None, flow_velocities=None):
+        self.forces = forces                    # (N x 3)
+        self.torques = torques                  # (N x 3)
+        self.submerged_ratio = submerged_ratio  # (N,)
+        self.surface_normals = surface_normals  # (N x 3) 잠긴 샘플의 평균 수면 법선, 요청 시에만
+        self.flow_velocities = flow_velocities  # (N x 3) 잠긴 샘플의 평균 물 입자 속도, relative 항력일 때만
+
+
+class BuoyancySolver:
+    """여러 물체의 부력/항력을 한 번에 계산
+
+    입력은 모두 배열이며 USD를 읽거나 쓰지 않는다.
+    같은 입력이면 항상 같은 결과를 내므로 기록/재생 비교에 사용한다.
+    """
+
+    @staticmethod
+    def compute_forces(samples, matrices, volumes, velocities, angular_velocities,
+                       time, wave, constants, slope_factor=0.0, surface_normals=False,
+                       drag_model="body"):
+        """물체별 힘/토크 계산
+
+        Args:
+            samples: 물체별 로컬 샘플 포인트 (K_i x 3) 리스트
+            matrices: 로컬 -> 월드 변환 (N x 4 x 4, 행 벡터 규약)
+            volumes: 물체 부피 (N,)
+            velocities: 선속도 (N x 3)
+            angular_velocities: 각속도 (N x 3)
+            time: 파도 시간
+            wave: WaveComponents (해당 시각에 평가된 파 성분)
+            constants: (water_density, gravity, drag_coefficient, angular_drag_coefficient)
+            slope_factor: 0이면 부력은 연직 방향, 1이면 잠긴 부분의 평균 수면 법선 방향
+            surface_normals: True면 결과에 물체별 평균 수면 법선 포함
+            drag_model: "body"면 물체 속도 하나로 정지한 물 기준 항력 (저비용),
+                "relative"면 잠긴 샘플마다 파도 궤도 속도에 대한 상대 유속으로 항력,
+                잠긴 샘플 유속의 강체 회전에 대한 상대 각속도로 각항력 계산
+
+        Returns:
+            BuoyancyResult
+        """
+        water_density, gravity, drag_coefficient, angular_drag_coefficient = constants
+        num_bodies = len(samples)
+        forces = np.zeros((num_bodies, 3))
+        torques = np.zeros((num_bodies, 3))
+        want_normals = surface_normals or slope_factor > 0
+        if drag_model not in ("body", "relative"):
+            raise ValueError(f"Unknown drag model: {drag_model}")
+        if num_bodies == 0:
+            return BuoyancyResult(forces, torques, np.zeros(0),
+                                  np.zeros((0, 3)) if want_normals else None,
+                                  np.zeros((0, 3)) if drag_model == "relative" else None)
+
+        matrices = np.asarray(matrices, dtype=np.float64)
+        volumes = np.asarray(volumes, dtype=np.float64)
+        velocities = np.asarray(velocities, dtype=np.float64)
+        angular_velocities = np.asarray(angular_velocities, dtype=np.float64)
+
+        # 모든 샘플을 하나의 배열로 모아 월드 좌표 변환
+        counts = np.array([len(s) for s in samples], dtype=np.int64)
+        body_index = np.repeat(np.arange(num_bodies), counts)
+        local_pts = np.concatenate(samples, axis=0)
+        world_pts = (np.einsum("mi,mij->mj", local_pts, matrices[body_index, :3, :3])
+                     + matrices[body_index, 3, :3])
+
+        # 잠긴 샘플 (높이, 법선, 궤도 속도를 같은 위상 계산에서 구함)
+        relative = drag_model == "relative"
+        water_heights, sample_normals, flow = wave.sample(
+            world_pts[:, 0], world_pts[:, 1], time, z=world_pts[:, 2],
+            normals=want_normals, velocities=relative, body_index=body_index
+        )
+        submerged = (water_heights - world_pts[:, 2]) > 0
+        num_submerged = np.bincount(body_index, weights=submerged, minlength=num_bodies)
+
+        wet = num_submerged > 0
+        safe_counts = np.where(wet, num_submerged, 1.0)
+        submerged_ratio = num_submerged / counts
+        submerged_volume = volumes * submerged_ratio
+        wet_weight = submerged[:, None]
+
+        sum_by_body = BuoyancySolver._sum_by_body
+        buoyancy_center = sum_by_body(body_index, world_pts * wet_weight, num_bodies) / safe_counts[:, None]
+
+        # 부력
+        buoyancy_magnitude = water_density * submerged_volume * gravity
+        mean_normals = None
+        if want_normals:
+            mean_normals = np.zeros((num_bodies, 3))
+            mean_normals[:, 2] = 1.0
+            summed = sum_by_body(body_index, sample_normals * wet_weight, num_bodies)
+            length = np.linalg.norm(summed, axis=1)
+            mean_normals[wet] = summed[wet] / length[wet, None]
+
+        buoyancy_force = np.zeros((num_bodies, 3))
+        if slope_factor > 0:
+            up = np.array([0.0, 0.0, 1.0])
+            direction = up + (mean_normals - up) * slope_factor
+            direction /= np.linalg.norm(direction, axis=1, keepdims=True)
+            buoyancy_force = direction * buoyancy_magnitude[:, None]
+        else:
+            buoyancy_force[:, 2] = buoyancy_magnitude
+
+        origins = matrices[:, 3, :3]
+        reference_area = submerged_volume ** (2.0 / 3.0)
+        mean_flow = None
+
+        if relative:
+            # 항력 (잠긴 샘플마다 샘플 속도 v + omega x r 의 물 입자 속도에 대한 상대 속도 사용)
+            # 각 샘플은 기준 면적을 잠긴 샘플 수로 나눈 만큼 담당
+            # 회전 항력은 아래 각항력이 물의 회전 속도 기준으로 한 번만 계산하므로 샘플 항력의 토크는 쓰지 않음
+            arm = world_pts - origins[body_index]
+            rel_velocity = velocities[body_index] + np.cross(angular_velocities[body_index], arm) - flow
+            rel_mag = np.linalg.norm(rel_velocity, axis=1)
+            active = submerged & (rel_mag > 0.01)
+            area_per_sample = (reference_area / safe_counts)[body_index]
+            sample_drag = -rel_velocity * np.where(
+                active, 0.5 * water_density * drag_coefficient * area_per_sample * rel_mag, 0.0)[:, None]
+            drag_force = sum_by_body(body_index, sample_drag, num_bodies)
+            drag_torque = np.zeros((num_bodies, 3))
+
+            # 물의 회전 속도 (잠긴 샘플 유속의 최소제곱 강체 회전)
+            # I * omega = sum(rc x (u - u_mean)),  I = sum(|rc|^2 E - rc rc^T)
+            mean_flow = sum_by_body(body_index, flow * wet_weight, num_bodies) / safe_counts[:, None]
+            rc = world_pts - buoyancy_center[body_index]
+            swirl = sum_by_body(body_index, np.cross(rc, flow - mean_flow[body_index]) * wet_weight,
+                                num_bodies)
+            flow_omega = BuoyancySolver._solve_rotation(body_index, rc * wet_weight, rc, swirl, num_bodies)
+            rel_omega = angular_velocities - flow_omega
+        else:
+            # 항력 (물체 속도 하나 사용, 정지한 물 기준)
+            v_mag = np.linalg.norm(velocities, axis=1)
+            dragging = wet & (v_mag > 0.01)
+            safe_v = np.where(dragging, v_mag, 1.0)
+            drag_magnitude = 0.5 * water_density * v_mag ** 2 * drag_coefficient * reference_area
+            drag_force = -(velocities / safe_v[:, None]) * np.where(dragging, drag_magnitude, 0.0)[:, None]
+            drag_torque = np.zeros((num_bodies, 3))
+            rel_omega = angular_velocities
+
+        # 토크
+        r = buoyancy_center - origins
+        buoyancy_torque = np.cross(r, buoyancy_force)
+
+        omega_mag = np.linalg.norm(rel_omega, axis=1)
+        spinning = wet & (omega_mag > 0.01)
+        safe_omega = np.where(spinning, omega_mag, 1.0)
+        angular_drag_magnitude = angular_drag_coefficient * omega_mag * submerged_volume
+        angular_drag_torque = (-(rel_omega / safe_omega[:, None])
+                               * np.where(spinning, angular_drag_magnitude, 0.0)[:, None])
+
+        forces[wet] = (buoyancy_force + drag_force)[wet]
+        torques[wet] = (buoyancy_torque + drag_torque + angular_drag_torque)[wet]
+        return BuoyancyResult(forces, torques, submerged_ratio, mean_normals, mean_flow)
+
+    @staticmethod
+    def _solve_rotation(body_index, weighted_rc, rc, swirl, num_bodies):
+        """물체별 관성 텐서로 강체 회전 속도 풀기 (N x 3)
+
+        샘플이 한 직선/점에 몰려 텐서가 특이하면 pinv로 최소 노름 해를 사용한다.
+        """
+        rr = np.einsum("mi,mi->m", weighted_rc, rc)
+        outer = weighted_rc[:, :, None] * rc[:, None, :]
+        flat = (rr[:, None, None] * np.eye(3) - outer).reshape(-1, 9)
+        inertia = np.stack([
+            np.bincount(body_index, weights=flat[:, k], minlength=num_bodies)
+            for k in range(9)
+        ], axis=1).reshape(num_bodies, 3, 3)
+
+        trace = np.trace(inertia, axis1=1, axis2=2)
+        regular = np.abs(np.linalg.det(inertia)) > 1e-9 * np.maximum(trace, 1e-12) ** 3
+        omega = np.zeros((num_bodies, 3))
+        if np.any(regular):
+            omega[regular] = np.linalg.solve(inertia[regular], swirl[regular][:, :, None])[:, :, 0]
+        singular = ~regular & (trace > 1e-12)
+        if np.any(singular):
+            omega[singular] = np.einsum("nij,nj->ni", np.linalg.pinv(inertia[singular]), swirl[singular])
+        return omega
+
+    @staticmethod
+    def _sum_by_body(body_index, values, num_bodies):
+        """샘플별 (M x 3) 값을 물체별 (N x 3) 합으로"""
+        return np.stack([
+            np.bincount(body_index, weights=values[:, axis], minlength=num_bodies)
+            for axis in range(3)
+        ], axis=1)
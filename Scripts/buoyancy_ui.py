@@ -128,13 +128,10 @@ class BuoyancyUI:
             s.model.set_value(20.0)
             l = ui.Label("20.0", width=50)
             def on_size(m):
-                stage = omni.usd.get_context().get_stage()
-                prim = stage.GetPrimAtPath(self.manager.mesh_path)
-                if prim:
-                    val = m.get_value_as_float()
-                    prim.GetAttribute("wave:size").Set(val)
-                    self.manager.update_water_tank_size(val)
-                    l.text = f"{val:.1f}"
+                # 드래그 중에는 라벨만 갱신, 탱크는 입력이 멈춘 뒤 한 번 갱신
+                val = m.get_value_as_float()
+                self.manager.request_water_tank_size(val)
+                l.text = f"{val:.1f}"
             s.model.add_value_changed_fn(on_size)
         
         # Resolution
@@ -3,17 +3,107 @@
 """
 
 class BuoyantObject:
-    """부력을 받는 개별 물체"""
-    def __init__(self, prim_path, material_density=50.0):
-        self.prim_path = prim_path
-        self.material_density = material_density
-        self.is_active = True
-        
-        # 물리 상수
-        self.water_density = 1000.0
-        self.gravity = 9.81
-        self.drag_coefficient = 1.0
-        self.angular_drag_coefficient = 1.0
-        
+    """부력을 받는 개별 물체
+
+    데이터는 BuoyancyRegistry의 배열에 있고, 이 객체는 handle만 가진 view이다.
+    """
+    __slots__ = ("registry", "handle")
+
+    def __init__(self, prim_path, material_density=50.0, prototype=None, scale=(1.0, 1.0, 1.0),
+                 registry=None):
+        if registry is None:
+            from .buoyancy_registry import BuoyancyRegistry
+            registry = BuoyancyRegistry(capacity=1)
+
+        view = registry.add(prim_path, material_density, prototype, scale)
+        self.registry = registry
+        self.handle = view.handle
+
         print(f"BuoyantObject registered: {prim_path}")
-        print(f"  Material density: {material_density} kg/m^3")
\ No newline at end of file
+        print(f"  Material density: {material_density} kg/m^3")
+
+    @classmethod
+    def from_handle(cls, registry, handle):
+        """등록된 handle에 대한 view 생성"""
+        view = object.__new__(cls)
+        view.registry = registry
+        view.handle = handle
+        return view
+
+    @property
+    def slot(self):
+        return self.registry.slot(self.handle)
+
+    @property
+    def is_valid(self):
+        return self.registry.has_handle(self.handle)
+
+    @property
+    def prim_path(self):
+        return self.registry.prim_paths[self.slot]
+
+    @property
+    def material_density(self):
+        return float(self.registry.material_density[self.slot])
+
+    @material_density.setter
+    def material_density(self, value):
+        self.registry.material_density[self.slot] = value
+
+    @property
+    def is_active(self):
+        return bool(self.registry.is_active[self.slot])
+
+    @is_active.setter
+    def is_active(self, value):
+        self.registry.is_active[self.slot] = value
+
+    # 공유 형상 데이터 (인스턴스는 스케일과 밀도만 보관)
+    @property
+    def prototype(self):
+        return self.registry.prototypes[self.slot]
+
+    @property
+    def samples(self):
+        return self.registry.samples[self.slot]
+
+    @property
+    def volume(self):
+        return float(self.registry.volume[self.slot])
+
+    @property
+    def scale(self):
+        return tuple(self.registry.scale[self.slot])
+
+    def set_scale(self, scale):
+        """월드 스케일 갱신 (샘플 그리드와 부피 재선택)"""
+        self.registry.set_scale(self.handle, scale)
+
+    # 물리 상수 (레지스트리 공통 값)
+    @property
+    def water_density(self):
+        return self.registry.water_density
+
+    @property
+    def gravity(self):
+        return self.registry.gravity
+
+    @property
+    def drag_coefficient(self):
+        return self.registry.drag_coefficient
+
+    @property
+    def angular_drag_coefficient(self):
+        return self.registry.angular_drag_coefficient
+
+    def __eq__(self, other):
+        return (isinstance(other, BuoyantObject) and
+                self.registry is other.registry and self.handle == other.handle)
+
+    def __hash__(self):
+        return hash((id(self.registry), self.handle))
+
+    def __repr__(self):
+        if not self.is_valid:
+            return f"BuoyantObject(handle={self.handle}, removed)"
+        return f"BuoyantObject({self.prim_path!r}, handle={self.handle})"
@@ -0,0 +1,129 @@
+"""
+PhysxForceAPI 힘/토크 일괄 기록
+"""
+import time as _time
+
+from pxr import Gf, Sdf
+
+
+class ForceWriter:
+    """프레임 단위로 힘/토크를 모아 하나의 Sdf.ChangeBlock 안에서 기록"""
+
+    FORCE_ATTR = "physxForce:force"
+    TORQUE_ATTR = "physxForce:torque"
+
+    def __init__(self, epsilon=1e-3):
+        self.epsilon = epsilon
+        self.last_write_time = 0.0
+        self.last_write_count = 0
+        self.last_skip_count = 0
+
+        self._pending = []
+        self._last_values = {}
+        self._spec_cache = {}
+        self._spec_layer = None
+
+    def queue(self, prim_path, force, torque):
+        """기록할 힘/토크 추가"""
+        self._pending.append((prim_path, force, torque))
+
+    def forget(self, prim_path):
+        """제거된 물체의 마지막 기록 값 삭제"""
+        self._last_values.pop(prim_path, None)
+        self._spec_cache.pop(prim_path, None)
+
+    def clear(self):
+        """모든 캐시 초기화"""
+        self._pending = []
+        self._last_values.clear()
+        self._spec_cache.clear()
+
+    def _get_specs(self, layer, prim_path):
+        """힘/토크 attribute spec 조회 (캐시)"""
+        specs = self._spec_cache.get(prim_path)
+        if specs is not None and not specs[0].expired and not specs[1].expired:
+            return specs
+        path = Sdf.Path(prim_path)
+        force_spec = layer.GetAttributeAtPath(path.AppendProperty(self.FORCE_ATTR))
+        torque_spec = layer.GetAttributeAtPath(path.AppendProperty(self.TORQUE_ATTR))
+        if not force_spec or not torque_spec:
+            return None
+        specs = (force_spec, torque_spec)
+        self._spec_cache[prim_path] = specs
+        return specs
+
+    def _changed(self, old, new):
+        """epsilon 이상 변했는지 확인"""
+        if old is None:
+            return True
+        eps = self.epsilon
+        return (abs(old[0] - new[0]) > eps or
+                abs(old[1] - new[1]) > eps or
+                abs(old[2] - new[2]) > eps)
+
+    def flush(self, stage):
+        """대기 중인 힘/토크를 레이어에 일괄 기록"""
+        start = _time.perf_counter()
+        pending = self._pending
+        self._pending = []
+
+        layer = stage.GetEditTarget().GetLayer()
+        if layer != self._spec_layer:
+            self._spec_cache.clear()
+            self._spec_layer = layer
+        fallback = []
+        written = 0
+        skipped = 0
+
+        with Sdf.ChangeBlock():
+            for prim_path, force, torque in pending:
+                last_force, last_torque = self._last_values.get(prim_path, (None, None))
+                if type(force) is not Gf.Vec3f:
+                    force = Gf.Vec3f(force[0], force[1], force[2])
+                if type(torque) is not Gf.Vec3f:
+                    torque = Gf.Vec3f(torque[0], torque[1], torque[2])
+
+                write_force = self._changed(last_force, force)
+                write_torque = self._changed(last_torque, torque)
+                if not write_force and not write_torque:
+                    skipped += 1
+                    continue
+
+                specs = self._get_specs(layer, prim_path)
+                if specs is not None:
+                    if write_force:
+                        specs[0].default = force
+                    if write_torque:
+                        specs[1].default = torque
+                    self._last_values[prim_path] = (
+                        force if write_force else last_force,
+                        torque if write_torque else last_torque,
+                    )
+                    written += 1
+                else:
+                    # 현재 edit target 레이어에 spec이 없으면 Usd API로 기록
+                    fallback.append((prim_path, force if write_force else None,
+                                     torque if write_torque else None))
+
+        # Usd API는 ChangeBlock 밖에서 호출 (기록에 성공한 값만 마지막 값으로 저장)
+        for prim_path, force, torque in fallback:
+            prim = stage.GetPrimAtPath(prim_path)
+            if not prim or not prim.IsValid():
+                continue
+            last_force, last_torque = self._last_values.get(prim_path, (None, None))
+            if force is not None:
+                attr = prim.GetAttribute(self.FORCE_ATTR)
+                if attr and attr.Set(force):
+                    last_force = force
+            if torque is not None:
+                attr = prim.GetAttribute(self.TORQUE_ATTR)
+                if attr and attr.Set(torque):
+                    last_torque = torque
+            if (last_force, last_torque) != self._last_values.get(prim_path, (None, None)):
+                self._last_values[prim_path] = (last_force, last_torque)
+                written += 1
+
+        self.last_write_count = written
+        self.last_skip_count = skipped
+        self.last_write_time = _time.perf_counter() - start
+        return written
@@ -9,17 +9,33 @@ Buoyancy Simulation - Main Entry Point
 5. 파라미터 조정으로 실험
 """
 
+import os
 import sys
-SCRIPTS_PATH = "/home/rain/isaac_sim_test/Scripts"  # 실제 Scripts 폴더 경로
-if SCRIPTS_PATH not in sys.path:
-    sys.path.insert(0, SCRIPTS_PATH)
 
-from buoyancy_manager import BuoyancyManager
+# 패키지 루트 (Scripts 폴더의 상위) 를 import 경로에 추가
+# Script Editor에서 __file__이 없으면 BUOYANCY_PACKAGE_ROOT, 그것도 없으면 현재 폴더 사용
+# (Kit의 현재 폴더는 앱 폴더이므로 보통 BUOYANCY_PACKAGE_ROOT 설정이 필요)
+try:
+    PACKAGE_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+except NameError:
+    PACKAGE_ROOT = os.environ.get("BUOYANCY_PACKAGE_ROOT", os.getcwd())
+if PACKAGE_ROOT not in sys.path:
+    sys.path.insert(0, PACKAGE_ROOT)
 
-# 기존 인스턴스 정리
+try:
+    from Scripts import BuoyancyManager
+except ModuleNotFoundError as ex:
+    if ex.name != "Scripts":
+        raise
+    raise ModuleNotFoundError(
+        f"Cannot import the Scripts package from {PACKAGE_ROOT}. "
+        "Set the BUOYANCY_PACKAGE_ROOT environment variable to the folder that contains Scripts "
+        "and run main.py again.", name="Scripts") from ex
+
+# 기존 인스턴스 정리 (메시/탱크는 새 인스턴스가 재사용)
 if 'buoyancy_mgr' in globals():
     try:
-        buoyancy_mgr.sub.unsubscribe()
+        buoyancy_mgr.shutdown()
     except:
         pass
 
@@ -45,4 +61,8 @@ print("\n✓ System ready")
 print("✓ Water tank created (Blue)")
 print("✓ Transparent water material applied")
 print("✓ Sun lighting enabled")
-print("\nTo stop: buoyancy_mgr.sub.unsubscribe()")
\ No newline at end of file
+print("\nTo stop: buoyancy_mgr.shutdown()")
+print("To add a water body: buoyancy_mgr.add_water_body('pool', center=(40.0, 0.0), size=10.0)")
+print("To enable wakes: buoyancy_mgr.enable_ripples(resolution=64)")
+print("To record: buoyancy_mgr.start_recording('/tmp/buoyancy.blog') ... buoyancy_mgr.stop_recording()")
+print("To replay (headless): python -m Scripts.buoyancy_recorder replay /tmp/buoyancy.blog")
\ No newline at end of file
@@ -0,0 +1,361 @@
+"""
+물체가 만드는 잔물결/항적 높이장 (numpy 전용, omni/pxr 불필요)
+"""
+import math
+
+import numpy as np
+
+
+class RippleField:
+    """수역 위의 거친 2D 격자에서 파동 방정식을 진행하는 잔물결 층
+
+    물체는 잠긴 부피만큼의 변위를 바닥 면적에 퍼뜨려 격자에 기록하고 (displace),
+    수면 높이 조회와 메시는 격자 높이를 Gerstner 수면에 더한다.
+    물체끼리 직접 비교하지 않으므로 프레임당 비용은 격자 크기와 물체 수에 선형이다.
+
+    격자는 선형이므로 물체 자신이 만든 잔물결은 바닥 반경별 임펄스 응답과 최근 부피 변화의
+    합성곱으로 구해 그 물체의 부력 조회에서 뺀다 (own_heights). 물체가 자기 변위를 다시 읽어
+    스스로 떠오르지 않고, 다른 물체가 만든 잔물결만 받는다.
+    """
+
+    # 안정 조건 (c * dt / dx <= 1/sqrt(2)) 여유
+    MAX_COURANT = 0.5
+
+    # 바닥 면적에 변위를 나눠 기록하는 축별 점 개수
+    FOOTPRINT_POINTS = 4
+
+    # 자기 잔물결 임펄스 응답 길이 [프레임] (복원 항 때문에 꼬리가 길다)
+    RESPONSE_FRAMES = 360
+
+    def __init__(self, center=(0.0, 0.0), size=20.0, resolution=64, wave_speed=2.0,
+                 damping=0.8, restoring=0.2, coupling=0.25, max_height=0.5):
+        self.resolution = int(resolution)
+        self.wave_speed = wave_speed    # 잔물결 전파 속도 [m/s]
+        self.damping = damping          # 속도 감쇠 [1/s]
+        self.restoring = restoring      # 높이를 0으로 되돌리는 정도 [1/s]
+        self.coupling = coupling        # 물체 변위 -> 격자 높이 배율
+        self.max_height = max_height    # 높이 제한 [m]
+        self.resize(center, size)
+
+    def resize(self, center, size):
+        """격자 영역 변경 (수역 크기가 바뀔 때, 잔물결은 초기화)"""
+        n = self.resolution
+        self.center = (float(center[0]), float(center[1]))
+        self.size = float(size)
+        self.cell = self.size / (n - 1)
+        self.origin = (self.center[0] - self.size / 2.0, self.center[1] - self.size / 2.0)
+        self._padded = np.zeros((n + 2, n + 2))
+        self._source = np.zeros(n * n)
+        self._responses = {}
+        self._dt = 1.0 / 60.0
+        self.reset()
+
+    def reset(self):
+        """격자와 물체 변위 초기화"""
+        n = self.resolution
+        self.height = np.zeros((n, n))
+        self._previous = np.zeros((n, n))
+        self._gradient = None
+        # 물체별 행 (key -> 행, 빈 행은 재사용): 지난 프레임 변위 (x, y, 부피, 반경),
+        # 최근 부피 변화 링 버퍼 (모든 행이 같은 열 _head에 기록), 반경 구간의 임펄스 응답
+        self._rows = {}
+        self._free = []
+        self._count = 0
+        self._head = 0
+        self._footprint = np.zeros((0, 4))
+        self._history = np.zeros((0, self.RESPONSE_FRAMES))
+        self._kernel = np.zeros((0, self.RESPONSE_FRAMES))
+        self._bucket = np.zeros(0, dtype=np.int64)
+        self._own = np.zeros(0)
+        self._kernel_dt = self._dt
+
+    def _reserve(self, count):
+        """행 배열 용량 확보 (2배씩 증가)"""
+        capacity = len(self._bucket)
+        if count <= capacity:
+            return
+        new_capacity = max(count, capacity * 2, 16)
+        for name in ("_footprint", "_history", "_kernel", "_bucket", "_own"):
+            old = getattr(self, name)
+            new = np.zeros((new_capacity,) + old.shape[1:], dtype=old.dtype)
+            new[:capacity] = old
+            setattr(self, name, new)
+        self._bucket[capacity:] = -1
+
+    def _bilinear(self, x, y):
+        """월드 좌표 -> (네 꼭짓점 평탄 index (M x 4), 가중치 (M x 4)), 격자 밖은 가중치 0"""
+        n = self.resolution
+        u = (np.asarray(x, dtype=np.float64).ravel() - self.origin[0]) / self.cell
+        v = (np.asarray(y, dtype=np.float64).ravel() - self.origin[1]) / self.cell
+        inside = (u >= 0) & (u <= n - 1) & (v >= 0) & (v <= n - 1)
+        i = np.clip(np.floor(u).astype(np.int64), 0, n - 2)
+        j = np.clip(np.floor(v).astype(np.int64), 0, n - 2)
+        fu = np.clip(u - i, 0.0, 1.0)
+        fv = np.clip(v - j, 0.0, 1.0)
+
+        # 꼭짓점 순서: (i, j), (i, j+1), (i+1, j), (i+1, j+1)
+        index = (i * n + j)[:, None] + np.array([0, 1, n, n + 1])
+        fu *= inside
+        weight = np.empty((len(u), 4))
+        weight[:, 2] = fu * (1.0 - fv)
+        weight[:, 3] = fu * fv
+        weight[:, 0] = (inside - fu) * (1.0 - fv)
+        weight[:, 1] = (inside - fu) * fv
+        return index, weight
+
+    def heights(self, x, y):
+        """월드 위치의 잔물결 높이 (M,)"""
+        index, weight = self._bilinear(x, y)
+        return np.einsum("mk,mk->m", self.height.ravel()[index], weight)
+
+    def gradients(self, x, y):
+        """월드 위치의 잔물결 기울기 (dh/dx, dh/dy)"""
+        if self._gradient is None:
+            gx, gy = np.gradient(self.height, self.cell)
+            self._gradient = (gx.ravel(), gy.ravel())
+        index, weight = self._bilinear(x, y)
+        gx, gy = self._gradient
+        return (np.einsum("mk,mk->m", gx[index], weight),
+                np.einsum("mk,mk->m", gy[index], weight))
+
+    def tilt_normals(self, x, y, normals):
+        """수면 법선에 잔물결 기울기를 더함 (normals를 제자리에서 수정 후 반환)
+
+        높이장 h = g + r 의 법선은 (-dg/dx - dr/dx, -dg/dy - dr/dy, 1) 방향이므로
+        단위 법선 n에 대해 n - n_z * (dr/dx, dr/dy, 0)을 정규화한다.
+        """
+        gx, gy = self.gradients(x, y)
+        nz = normals[:, 2].astype(np.float64)
+        nx = normals[:, 0] - gx * nz
+        ny = normals[:, 1] - gy * nz
+        inv = 1.0 / np.sqrt(nx * nx + ny * ny + nz * nz)
+        normals[:, 0] = nx * inv
+        normals[:, 1] = ny * inv
+        normals[:, 2] = nz * inv
+        return normals
+
+    def _splat(self, x, y, amounts):
+        """값을 격자 꼭짓점에 bilinear 분배 (평탄 배열 누적)"""
+        if len(amounts) == 0:
+            return
+        index, weight = self._bilinear(x, y)
+        self._source += np.bincount(index.ravel(), weights=(weight * np.asarray(amounts)[:, None]).ravel(),
+                                    minlength=self._source.size)
+
+    def _footprint_points(self, x, y, radii):
+        """물체별 정사각형 바닥 (한 변 2 * 반경)의 고른 점들 (N x k^2)"""
+        k = self.FOOTPRINT_POINTS
+        offsets = (np.arange(k) + 0.5) / k * 2.0 - 1.0
+        ox, oy = np.meshgrid(offsets, offsets, indexing="ij")
+        return (x[:, None] + radii[:, None] * ox.ravel(),
+                y[:, None] + radii[:, None] * oy.ravel())
+
+    def _inject(self, x, y, volumes, radii):
+        """부피를 바닥에 고르게 분배해 높이에 더함 (음수는 제거)"""
+        px, py = self._footprint_points(x, y, radii)
+        self._splat(px.ravel(), py.ravel(), np.repeat(volumes / px.shape[1], px.shape[1]))
+
+    def _apply_source(self):
+        """누적한 변위를 3x3 평균으로 퍼뜨려 높이에 반영"""
+        n = self.resolution
+        padded = self._padded
+        padded[1:-1, 1:-1] = self._source.reshape(n, n)
+        padded[0, :] = padded[-1, :] = 0.0
+        padded[:, 0] = padded[:, -1] = 0.0
+        spread = sum(padded[1 + di:n + 1 + di, 1 + dj:n + 1 + dj]
+                     for di in (-1, 0, 1) for dj in (-1, 0, 1)) / 9.0
+
+        # 이전 높이에도 더해 변위만 옮기고 속도는 주지 않음
+        offset = spread * (self.coupling / (self.cell * self.cell))
+        self.height += offset
+        self._previous += offset
+        np.clip(self.height, -self.max_height, self.max_height, out=self.height)
+        np.clip(self._previous, -self.max_height, self.max_height, out=self._previous)
+        self._gradient = None
+
+    def _bucket_of(self, radii):
+        """반경 -> 응답 캐시 구간 (셀 1/4 단위)"""
+        return np.rint(np.asarray(radii) / (0.25 * self.cell)).astype(np.int64)
+
+    def _response(self, bucket):
+        """반경 구간 바닥에 단위 부피를 넣은 뒤 프레임별 바닥 평균 높이 (RESPONSE_FRAMES,)
+
+        같은 셀 크기와 계수의 벽 없는 작은 격자에서 한 번 진행해 구간별로 캐시한다.
+        """
+        key = (int(bucket), self._dt)
+        response = self._responses.get(key)
+        if response is not None:
+            return response
+
+        radius = int(bucket) * 0.25 * self.cell
+        frames = self.RESPONSE_FRAMES
+        # 벽 반사가 응답 길이 안에 바닥으로 돌아오지 않는 크기
+        reach = radius + 0.5 * self.wave_speed * frames * self._dt + 3.0 * self.cell
+        scratch = RippleField(size=2.0 * reach, resolution=int(math.ceil(2.0 * reach / self.cell)) + 1,
+                              wave_speed=self.wave_speed, damping=self.damping, restoring=self.restoring,
+                              coupling=self.coupling, max_height=np.inf)
+        origin = np.zeros(1)
+        scratch._inject(origin, origin, np.ones(1), np.full(1, radius))
+        scratch._apply_source()
+        px, py = self._footprint_points(origin, origin, np.full(1, radius))
+        response = np.empty(frames)
+        for frame in range(frames):
+            scratch.step(self._dt)
+            response[frame] = scratch.heights(px, py).mean()
+        self._responses[key] = response
+        return response
+
+    def displace(self, keys, x, y, volumes, radii):
+        """물체 변위 기록 (물체 key, 위치 x, y, 잠긴 부피, 바닥 반경)
+
+        지난 프레임 변위를 빼고 이번 변위를 더하므로 정지한 물체는 격자를 바꾸지 않고,
+        움직이거나 잠김 정도가 변한 물체만 잔물결을 만든다.
+        처음 보는 물체는 이미 떠 있던 것으로 보고 변위를 격자에 넣지 않고 기록만 하며
+        (잔물결을 켠 직후나 물체가 수역에 들어온 순간의 급격한 높이 변화 방지),
+        사라진 물체의 변위는 버린다.
+        """
+        keys = [int(key) for key in keys]
+        footprint = np.empty((len(keys), 4))
+        footprint[:, 0] = np.asarray(x, dtype=np.float64).ravel()
+        footprint[:, 1] = np.asarray(y, dtype=np.float64).ravel()
+        footprint[:, 2] = np.asarray(volumes, dtype=np.float64).ravel()
+        footprint[:, 3] = np.asarray(radii, dtype=np.float64).ravel()
+
+        # 사라진 물체의 행 반납, 처음 보는 물체에 행 배정
+        current = set(keys)
+        for key in [key for key in self._rows if key not in current]:
+            row = self._rows.pop(key)
+            self._footprint[row, 2] = 0.0
+            self._history[row] = 0.0
+            self._own[row] = 0.0
+            self._free.append(row)
+        rows = np.array([self._rows.get(key, -1) for key in keys], dtype=np.int64)
+        seen = rows >= 0
+        new_keys = np.flatnonzero(~seen)
+        if len(new_keys):
+            self._reserve(self._count + len(new_keys) - len(self._free))
+            for i in new_keys:
+                if self._free:
+                    row = self._free.pop()
+                else:
+                    row = self._count
+                    self._count += 1
+                rows[i] = row
+                self._rows[keys[i]] = row
+                self._history[row] = 0.0
+
+        old = self._footprint[rows[seen]]
+        new = footprint[seen]
+        moved = np.concatenate([new, old])
+        moved[len(new):, 2] *= -1.0
+        self._source[:] = 0.0
+        self._inject(moved[:, 0], moved[:, 1], moved[:, 2], moved[:, 3])
+        self._apply_source()
+
+        # 링 버퍼 다음 열에 부피 변화 기록 (처음 보는 물체는 0)
+        self._head = (self._head + 1) % self.RESPONSE_FRAMES
+        change = np.zeros(len(keys))
+        change[seen] = new[:, 2] - old[:, 2]
+        live = self._history[:self._count]
+        live[:, self._head] = 0.0
+        self._history[rows, self._head] = change
+        self._footprint[rows] = footprint
+
+        # 반경 구간이 바뀐 행만 임펄스 응답 교체
+        if self._kernel_dt != self._dt:
+            self._bucket[:] = -1
+            self._kernel_dt = self._dt
+        buckets = self._bucket_of(footprint[:, 3])
+        for i in np.flatnonzero(self._bucket[rows] != buckets):
+            self._kernel[rows[i]] = self._response(buckets[i])
+            self._bucket[rows[i]] = buckets[i]
+
+        # 자기 잔물결 높이 = sum_k kernel[k] * 변화[head - k] (링 버퍼를 두 구간으로 나눠 복사 없이 계산)
+        head = self._head
+        kernel = self._kernel[:self._count]
+        own = np.einsum("nk,nk->n", live[:, :head + 1], kernel[:, head::-1])
+        if head + 1 < self.RESPONSE_FRAMES:
+            own += np.einsum("nk,nk->n", live[:, head + 1:], kernel[:, :head:-1])
+        self._own[:self._count] = own
+
+    def own_heights(self, keys):
+        """물체별로 자기 바닥 아래에 남아 있는 자기 잔물결 높이 (기록 전 물체는 0)"""
+        rows = np.array([self._rows.get(int(key), -1) for key in keys], dtype=np.int64)
+        heights = np.zeros(len(rows))
+        seen = rows >= 0
+        heights[seen] = self._own[rows[seen]]
+        return heights
+
+    def step(self, dt):
+        """dt만큼 진행 (안정 조건을 넘으면 고정 개수의 하위 스텝으로 분할)"""
+        courant = self.wave_speed * dt / self.cell
+        substeps = max(1, int(math.ceil(courant / self.MAX_COURANT)))
+        h = dt / substeps
+        c2 = (self.wave_speed * h / self.cell) ** 2
+        keep = 1.0 - min(1.0, self.damping * h)
+        relax = 1.0 - min(1.0, self.restoring * h)
+
+        padded = self._padded
+        for _ in range(substeps):
+            # 벽에서 반사 (가장자리 복제)
+            padded[1:-1, 1:-1] = self.height
+            padded[0, 1:-1] = self.height[0]
+            padded[-1, 1:-1] = self.height[-1]
+            padded[1:-1, 0] = self.height[:, 0]
+            padded[1:-1, -1] = self.height[:, -1]
+            laplacian = (padded[:-2, 1:-1] + padded[2:, 1:-1] + padded[1:-1, :-2] + padded[1:-1, 2:]
+                         - 4.0 * self.height)
+
+            current = self.height
+            following = (current + (current - self._previous) * keep + c2 * laplacian) * relax
+            np.clip(following, -self.max_height, self.max_height, out=following)
+            self._previous = current
+            self.height = following
+        self._gradient = None
+        self._dt = dt
+
+    def compose(self, wave):
+        """파 성분에 잔물결 높이를 더한 수면"""
+        return RippleSurface(wave, self)
+
+
+class RippleSurface:
+    """Gerstner 파 성분 + 잔물결 높이
+
+    WaveComponents와 같은 sample/evaluate_surface를 제공하므로
+    BuoyancySolver와 WaveMesh.update_wave_mesh에 그대로 넘길 수 있다.
+    keys를 주면 (for_bodies) sample의 body_index에 해당하는 물체의 자기 변위를 뺀다.
+    """
+
+    def __init__(self, wave, ripple, keys=None):
+        self.wave = wave
+        self.ripple = ripple
+        self.keys = keys
+
+    def __len__(self):
+        return len(self.wave)
+
+    def for_bodies(self, keys):
+        """BuoyancySolver에 넘길 물체 순서 (body_index -> RippleField key)를 지정한 수면"""
+        return RippleSurface(self.wave, self.ripple, keys)
+
+    def sample(self, x, y, time, z=None, normals=False, velocities=False, body_index=None):
+        """WaveComponents.sample + 잔물결 높이/기울기 (궤도 속도는 Gerstner 성분만)"""
+        heights, normal_out, velocity_out = self.wave.sample(
+            x, y, time, z=z, normals=normals, velocities=velocities)
+        heights = heights + self.ripple.heights(x, y)
+        if self.keys is not None and body_index is not None:
+            heights -= self.ripple.own_heights(self.keys)[body_index]
+        if normals:
+            self.ripple.tilt_normals(x, y, normal_out)
+        return heights, normal_out, velocity_out
+
+    def evaluate_surface(self, x, y, time, tangents=False, out=None):
+        """WaveComponents.evaluate_surface + 잔물결 (변형 전 격자 위치에서 조회)"""
+        return self.wave.evaluate_surface(x, y, time, tangents=tangents, out=out,
+                                          offset=self.ripple.heights(x, y),
+                                          offset_slope=self.ripple.gradients(x, y))
+
+    def to_array(self):
+        """기록용 직렬화 (Gerstner 성분만, 잔물결 격자는 기록하지 않음)"""
+        return self.wave.to_array()
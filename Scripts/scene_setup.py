@@ -21,10 +21,10 @@ class SceneSetup:
     @staticmethod
     def setup_lighting(stage):
         """조명 설정"""
-        # Distant Light (태양광)
+        # Distant Light (태양광, 이미 있으면 재사용)
         sun_light_path = "/World/SunLight"
         if stage.GetPrimAtPath(sun_light_path):
-            stage.RemovePrim(sun_light_path)
+            return
         
         sun_light = UsdLux.DistantLight.Define(stage, sun_light_path)
         sun_light.CreateIntensityAttr(8000.0)
@@ -35,52 +35,85 @@ class SceneSetup:
         
         print("Lighting setup complete (Sun light only)")
     
+    TANK_MATERIAL_PATH = "/World/Looks/TankMaterial"
+    WALL_THICKNESS = 0.5
+    WALL_HEIGHT = 5.0
+    WALL_NAMES = ("Wall_North", "Wall_South", "Wall_East", "Wall_West", "Floor")
+    
     @staticmethod
-    def create_water_tank(stage, tank_path, size=20.0):
-        """물 탱크 생성 (4면 벽 + 바닥)"""
-        # 기존 탱크 제거
-        if stage.GetPrimAtPath(tank_path):
-            stage.RemovePrim(tank_path)
-        
-        # 탱크 그룹 생성
-        UsdGeom.Xform.Define(stage, tank_path)
-        
-        wall_thickness = 0.5
-        wall_height = 5.0
+    def get_tank_material(stage):
+        """파란색 탱크 재질 (이미 있으면 재사용)"""
+        prim = stage.GetPrimAtPath(SceneSetup.TANK_MATERIAL_PATH)
+        if prim and prim.IsA(UsdShade.Material):
+            return UsdShade.Material(prim)
         
-        # 파란색 재질 생성
-        tank_material_path = "/World/Looks/TankMaterial"
-        tank_material = UsdShade.Material.Define(stage, tank_material_path)
+        tank_material = UsdShade.Material.Define(stage, SceneSetup.TANK_MATERIAL_PATH)
         
-        tank_shader = UsdShade.Shader.Define(stage, tank_material_path + "/Shader")
+        tank_shader = UsdShade.Shader.Define(stage, SceneSetup.TANK_MATERIAL_PATH + "/Shader")
         tank_shader.CreateIdAttr("UsdPreviewSurface")
         tank_shader.CreateInput("diffuseColor", Sdf.ValueTypeNames.Color3f).Set((0.1, 0.3, 0.8))
         tank_shader.CreateInput("metallic", Sdf.ValueTypeNames.Float).Set(0.1)
         tank_shader.CreateInput("roughness", Sdf.ValueTypeNames.Float).Set(0.4)
         
         tank_material.CreateSurfaceOutput().ConnectToSource(tank_shader.ConnectableAPI(), "surface")
-        
-        # 벽 정의
-        walls = [
-            ("Wall_North", 0, size/2, size + wall_thickness, wall_thickness, wall_height),
-            ("Wall_South", 0, -size/2, size + wall_thickness, wall_thickness, wall_height),
-            ("Wall_East", size/2, 0, wall_thickness, size + wall_thickness, wall_height),
-            ("Wall_West", -size/2, 0, wall_thickness, size + wall_thickness, wall_height),
-            ("Floor", 0, 0, size, size, wall_thickness)
+        return tank_material
+    
+    @staticmethod
+    def tank_layout(size):
+        """벽별 (이름, 위치, 스케일)"""
+        t = SceneSetup.WALL_THICKNESS
+        h = SceneSetup.WALL_HEIGHT
+        return [
+            ("Wall_North", (0, size/2, 0), (size + t, t, h)),
+            ("Wall_South", (0, -size/2, 0), (size + t, t, h)),
+            ("Wall_East", (size/2, 0, 0), (t, size + t, h)),
+            ("Wall_West", (-size/2, 0, 0), (t, size + t, h)),
+            ("Floor", (0, 0, -h/2), (size, size, t)),
         ]
+    
+    @staticmethod
+    def create_water_tank(stage, tank_path, size=20.0, center=(0.0, 0.0), level=0.0):
+        """물 탱크 생성 또는 갱신 (4면 벽 + 바닥, center/level은 수역 중심과 수면 기준 높이)
+        
+        탱크가 이미 있으면 벽 변환만 제자리에서 갱신하고 (prim/재질 재생성 없음),
+        모든 편집은 하나의 Sdf.ChangeBlock으로 묶어 알림을 한 번만 보낸다.
+        """
+        layer = stage.GetEditTarget().GetLayer()
+        specs = SceneSetup._find_tank_specs(layer, tank_path)
+        
+        if specs is None:
+            # 일부만 남은 탱크는 제거 후 새로 작성
+            if stage.GetPrimAtPath(tank_path):
+                stage.RemovePrim(tank_path)
+            SceneSetup._build_tank(stage, tank_path, size, center, level)
+            print(f"Water tank created: {size}m x {size}m x {SceneSetup.WALL_HEIGHT}m (Blue color)")
+            return
+        
+        with Sdf.ChangeBlock():
+            changed = SceneSetup._set_spec(specs["root"], Gf.Vec3d(center[0], center[1], level))
+            for wall_name, translate, scale in SceneSetup.tank_layout(size):
+                translate_spec, scale_spec = specs[wall_name]
+                changed += SceneSetup._set_spec(translate_spec, Gf.Vec3d(*translate))
+                changed += SceneSetup._set_spec(scale_spec, Gf.Vec3f(*scale))
         
-        for wall_name, pos_x, pos_y, scale_x, scale_y, scale_z in walls:
-            wall_path = f"{tank_path}/{wall_name}"
-            cube = UsdGeom.Cube.Define(stage, wall_path)
+        if changed:
+            print(f"Water tank resized in place: {size}m x {size}m")
+    
+    @staticmethod
+    def _build_tank(stage, tank_path, size, center, level):
+        """탱크 prim 새로 작성 (정적 충돌체 벽 + 탱크 재질 바인딩)"""
+        tank_material = SceneSetup.get_tank_material(stage)
+        
+        tank = UsdGeom.Xform.Define(stage, tank_path)
+        UsdGeom.XformCommonAPI(tank).SetTranslate((center[0], center[1], level))
+        
+        for wall_name, translate, scale in SceneSetup.tank_layout(size):
+            cube = UsdGeom.Cube.Define(stage, f"{tank_path}/{wall_name}")
             cube.CreateSizeAttr(1.0)
             
             xform_api = UsdGeom.XformCommonAPI(cube)
-            xform_api.SetScale(Gf.Vec3f(scale_x, scale_y, scale_z))
-            
-            if wall_name == "Floor":
-                xform_api.SetTranslate((pos_x, pos_y, -wall_height/2))
-            else:
-                xform_api.SetTranslate((pos_x, pos_y, 0))
+            xform_api.SetScale(Gf.Vec3f(*scale))
+            xform_api.SetTranslate(translate)
             
             prim = cube.GetPrim()
             UsdPhysics.CollisionAPI.Apply(prim)
@@ -89,6 +122,28 @@ class SceneSetup:
                 rigid_body = UsdPhysics.RigidBodyAPI.Apply(prim)
                 rigid_body.CreateRigidBodyEnabledAttr(False)
             
-            UsdShade.MaterialBindingAPI(prim).Bind(tank_material)
-        
-        print(f"Water tank created: {size}m x {size}m x {wall_height}m (Blue color)")
\ No newline at end of file
+            UsdShade.MaterialBindingAPI.Apply(prim).Bind(tank_material)
+    
+    @staticmethod
+    def _set_spec(spec, value):
+        """값이 다를 때만 기록, 기록 여부 반환"""
+        if spec.default == value:
+            return 0
+        spec.default = value
+        return 1
+    
+    @staticmethod
+    def _find_tank_specs(layer, tank_path):
+        """편집 레이어에 있는 탱크 변환 속성 spec (하나라도 없으면 None)"""
+        root = layer.GetAttributeAtPath(Sdf.Path(tank_path).AppendProperty("xformOp:translate"))
+        if root is None:
+            return None
+        specs = {"root": root}
+        for wall_name in SceneSetup.WALL_NAMES:
+            wall_path = Sdf.Path(f"{tank_path}/{wall_name}")
+            translate = layer.GetAttributeAtPath(wall_path.AppendProperty("xformOp:translate"))
+            scale = layer.GetAttributeAtPath(wall_path.AppendProperty("xformOp:scale"))
+            if translate is None or scale is None:
+                return None
+            specs[wall_name] = (translate, scale)
+        return specs
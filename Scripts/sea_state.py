@@ -0,0 +1,148 @@
+"""
+시간에 따라 변하는 해상 상태 (키프레임 트랙, numpy 전용)
+"""
+import numpy as np
+
+from .wave_field import WaveComponents
+
+
+class SeaStateTrack:
+    """한 파라미터의 키프레임 트랙 (모든 성분 값을 키마다 배열로 보관)"""
+
+    def __init__(self, times, values):
+        self.times = np.asarray(times, dtype=np.float64)
+        self.values = np.asarray(values, dtype=np.float64).reshape(len(self.times), -1)
+        if len(self.times) == 0:
+            raise ValueError("SeaStateTrack needs at least one keyframe")
+        if np.any(np.diff(self.times) < 0):
+            raise ValueError("SeaStateTrack keyframe times must be sorted")
+        self._cursor = 0
+
+    def evaluate(self, time):
+        """선형 보간 값 (C,)
+
+        직전 구간 위치를 기억하므로 시간이 순서대로 진행하면
+        키프레임 개수와 무관하게 프레임당 비용이 일정하다.
+        """
+        times = self.times
+        last = len(times) - 1
+        if time <= times[0]:
+            return self.values[0]
+        if time >= times[last]:
+            return self.values[last]
+
+        i = self._cursor
+        if not times[i] <= time < times[i + 1]:
+            if i + 2 <= last and times[i + 1] <= time < times[i + 2]:
+                i += 1
+            else:
+                i = int(np.searchsorted(times, time, side="right")) - 1
+            self._cursor = i
+
+        t0, t1 = times[i], times[i + 1]
+        alpha = (time - t0) / (t1 - t0) if t1 > t0 else 1.0
+        return self.values[i] + (self.values[i + 1] - self.values[i]) * alpha
+
+
+class SeaStateProfile:
+    """성분별 진폭/파장/속도/경사도/방향 트랙으로 구성된 해상 상태
+
+    direction 트랙은 각도(라디안)로 보간한다. 매 프레임 evaluate(time)이
+    한 번 호출되어 WaveComponents(미리 계산한 상수 포함)를 만든다.
+    """
+
+    PARAMETERS = ("amplitude", "wavelength", "speed", "steepness", "direction")
+
+    def __init__(self, amplitude, wavelength, speed, steepness, direction):
+        self.tracks = {
+            "amplitude": amplitude,
+            "wavelength": wavelength,
+            "speed": speed,
+            "steepness": steepness,
+            "direction": direction,
+        }
+        sizes = {track.values.shape[1] for track in self.tracks.values()}
+        if len(sizes) != 1:
+            raise ValueError(f"All tracks must have the same component count, got {sorted(sizes)}")
+        self.num_components = sizes.pop()
+
+    @staticmethod
+    def _angles(components):
+        return np.arctan2(components.direction[:, 1], components.direction[:, 0])
+
+    @classmethod
+    def from_keyframes(cls, keyframes):
+        """[(time, WaveComponents), ...] 목록에서 생성 (모든 트랙이 같은 키 사용)"""
+        keyframes = sorted(keyframes, key=lambda item: item[0])
+        times = [t for t, _ in keyframes]
+        comps = [c for _, c in keyframes]
+
+        angles = np.unwrap(np.array([cls._angles(c) for c in comps]), axis=0)
+        return cls(
+            SeaStateTrack(times, [c.amplitude for c in comps]),
+            SeaStateTrack(times, [c.wavelength for c in comps]),
+            SeaStateTrack(times, [c.speed for c in comps]),
+            SeaStateTrack(times, [c.steepness for c in comps]),
+            SeaStateTrack(times, angles),
+        )
+
+    @classmethod
+    def constant(cls, components):
+        """변하지 않는 해상 상태"""
+        return cls.from_keyframes([(0.0, components)])
+
+    @classmethod
+    def ramp(cls, start, end, t_start, t_end):
+        """t_start ~ t_end 동안 start -> end로 선형 변화"""
+        return cls.from_keyframes([(t_start, start), (t_end, end)])
+
+    @classmethod
+    def storm(cls, calm, peak, t_start, t_peak, t_hold, t_end):
+        """calm -> peak 상승, t_hold까지 유지 후 t_end까지 calm으로 복귀"""
+        return cls.from_keyframes([(t_start, calm), (t_peak, peak), (t_hold, peak), (t_end, calm)])
+
+    def set_track(self, parameter, times, values):
+        """파라미터 하나의 트랙 교체 (예: 성분별 방향만 별도 키프레임)
+
+        direction은 성분별 각도(라디안) 값을 받는다.
+        """
+        if parameter not in self.PARAMETERS:
+            raise KeyError(f"Unknown sea state parameter: {parameter}")
+        track = SeaStateTrack(times, values)
+        if track.values.shape[1] != self.num_components:
+            raise ValueError(f"Track has {track.values.shape[1]} components, "
+                             f"profile has {self.num_components}")
+        self.tracks[parameter] = track
+
+    def evaluate(self, time):
+        """해당 시각의 파 성분 (미리 계산한 상수 포함)"""
+        tracks = self.tracks
+        angle = tracks["direction"].evaluate(time)
+        direction = np.stack([np.cos(angle), np.sin(angle)], axis=1)
+        return WaveComponents(
+            tracks["amplitude"].evaluate(time),
+            tracks["wavelength"].evaluate(time),
+            tracks["speed"].evaluate(time),
+            tracks["steepness"].evaluate(time),
+            direction,
+            normalize=False,
+        )
+
+    @staticmethod
+    def directional_spread(amplitude, wavelength, speed, steepness, mean_direction_deg,
+                           spread_deg, num_components):
+        """주 방향 주변으로 퍼진 성분 목록 (2개 고정 방향 대신 사용)"""
+        n = max(1, int(num_components))
+        offsets = np.linspace(-0.5, 0.5, n) * spread_deg if n > 1 else np.zeros(1)
+        angles = np.radians(mean_direction_deg + offsets)
+        idx = np.arange(n, dtype=np.float64)
+        # 주 방향에서 멀수록 진폭 감소 (에너지 합 = amplitude^2 유지)
+        # 파장/속도는 조금씩 다르게 (반복 패턴 방지)
+        weight = np.cos(np.radians(offsets)) ** 2
+        return WaveComponents(
+            amplitude * np.sqrt(weight / weight.sum()),
+            wavelength * (1.0 + 0.3 * idx / max(1, n - 1)),
+            speed * (1.0 - 0.1 * idx / max(1, n - 1)),
+            np.full(n, float(steepness)),
+            np.stack([np.cos(angles), np.sin(angles)], axis=1),
+        )
@@ -0,0 +1,197 @@
+"""
+여러 수역(수조/해역) 관리 및 공간 조회 (numpy 전용, omni/pxr 불필요)
+"""
+import math
+
+import numpy as np
+
+
+class WaterBody:
+    """하나의 수역: 영역, 수면 높이, 파도 모델, USD 경로"""
+
+    def __init__(self, name, center=(0.0, 0.0), size=20.0, level=0.0,
+                 mesh_path=None, tank_path=None, resolution=20, sea_state=None, priority=0):
+        self.name = name
+        self.center = (float(center[0]), float(center[1]))
+        self.size = float(size)
+        self.level = float(level)
+        self.mesh_path = mesh_path
+        self.tank_path = tank_path
+        self.resolution = resolution
+        self.priority = priority
+
+        # SeaStateProfile (None이면 mesh prim의 wave:* 속성 사용)
+        self.sea_state = sea_state
+
+        # 물체가 만드는 잔물결 층 (RippleField, None이면 사용 안 함)
+        self.ripple = None
+
+        # WaveMesh가 이 수역에 재사용하는 파 성분/격자 버퍼
+        self.mesh_cache = {}
+
+    @property
+    def bounds(self):
+        """(min_x, min_y, max_x, max_y)"""
+        half = self.size / 2.0
+        cx, cy = self.center
+        return (cx - half, cy - half, cx + half, cy + half)
+
+    def contains(self, x, y):
+        min_x, min_y, max_x, max_y = self.bounds
+        return min_x <= x <= max_x and min_y <= y <= max_y
+
+
+class WaterBodyRegistry:
+    """수역 목록과 균일 격자 공간 색인
+
+    물체의 수역 배정은 호출자가 배열로 보관하고 (assign), 물체가 그 영역 안에
+    있는 동안은 영역 검사 한 번으로 재사용한다. 배정된 수역과 겹치는 우선순위가 더 높은
+    수역(예: 바다 안의 항구)은 수역별 짧은 목록으로 함께 검사해, 그 안에 들어온 물체와
+    영역을 벗어난 물체만 격자 셀에서 후보를 찾는다. 수역이 늘어나도 프레임당 비용은 거의 일정하다.
+
+    셀 크기는 수역 크기의 중앙값이며, 셀을 MAX_REGION_CELLS개보다 많이 덮는 큰 수역
+    (예: 작은 수조들 옆의 대양)은 격자에 넣지 않고 별도 목록에서 검사한다.
+    """
+
+    # 수역 하나가 격자에 등록될 수 있는 최대 셀 수
+    MAX_REGION_CELLS = 256
+
+    def __init__(self, cell_size=None):
+        self.water_bodies = []
+        self.cell_size = cell_size
+        self.generation = 0
+
+        self._bounds = np.zeros((0, 4))
+        self._rank = np.zeros(0, dtype=np.int64)
+        self._shadows = []
+        self._large = []
+        self._cells = {}
+        self._cell = 1.0
+
+    def __len__(self):
+        return len(self.water_bodies)
+
+    def __iter__(self):
+        return iter(self.water_bodies)
+
+    def add(self, water_body):
+        """수역 추가 (이름 중복 불가)"""
+        if self.get(water_body.name) is not None:
+            raise KeyError(f"Water body already exists: {water_body.name}")
+        self.water_bodies.append(water_body)
+        self.rebuild_index()
+        return water_body
+
+    def remove(self, name):
+        """수역 제거 (배정 결과는 모두 무효화)"""
+        water_body = self.get(name)
+        if water_body is None:
+            return None
+        self.water_bodies.remove(water_body)
+        self.rebuild_index()
+        return water_body
+
+    def get(self, name):
+        for water_body in self.water_bodies:
+            if water_body.name == name:
+                return water_body
+        return None
+
+    def index_of(self, name):
+        for index, water_body in enumerate(self.water_bodies):
+            if water_body.name == name:
+                return index
+        return -1
+
+    def rebuild_index(self):
+        """격자 색인 재구성 (수역 추가/제거/영역 변경 시 호출)"""
+        self.generation += 1
+        self._bounds = np.array([w.bounds for w in self.water_bodies], dtype=np.float64).reshape(-1, 4)
+        self._cells = {}
+        self._large = []
+        self._shadows = []
+        self._rank = np.zeros(0, dtype=np.int64)
+        if not self.water_bodies:
+            return
+
+        sizes = [w.size for w in self.water_bodies]
+        self._cell = float(self.cell_size or max(1e-3, float(np.median(sizes))))
+
+        # 우선순위 높은 순서로 셀에 등록 (lookup이 검사하는 순서)
+        order = sorted(range(len(self.water_bodies)),
+                       key=lambda i: -self.water_bodies[i].priority)
+        self._rank = np.empty(len(order), dtype=np.int64)
+        self._rank[order] = np.arange(len(order))
+
+        # 수역별로 lookup에서 먼저 검사되면서 겹치는 수역 (배정 캐시를 쓸 때 함께 검사)
+        b = self._bounds
+        overlaps = ((b[:, None, 0] <= b[None, :, 2]) & (b[None, :, 0] <= b[:, None, 2])
+                    & (b[:, None, 1] <= b[None, :, 3]) & (b[None, :, 1] <= b[:, None, 3]))
+        earlier = overlaps & (self._rank[None, :] < self._rank[:, None])
+        self._shadows = [np.flatnonzero(row) for row in earlier]
+
+        for index in order:
+            min_x, min_y, max_x, max_y = self._bounds[index]
+            x_range = range(self._cell_coord(min_x), self._cell_coord(max_x) + 1)
+            y_range = range(self._cell_coord(min_y), self._cell_coord(max_y) + 1)
+            if len(x_range) * len(y_range) > self.MAX_REGION_CELLS:
+                self._large.append(index)
+                continue
+            for cx in x_range:
+                for cy in y_range:
+                    self._cells.setdefault((cx, cy), []).append(index)
+
+    def _cell_coord(self, value):
+        return int(math.floor(value / self._cell))
+
+    def lookup(self, x, y):
+        """위치를 포함하는 수역 index (없으면 -1)"""
+        candidates = self._cells.get((self._cell_coord(x), self._cell_coord(y)), [])
+        if self._large:
+            candidates = sorted(candidates + self._large, key=lambda i: self._rank[i])
+        for index in candidates:
+            min_x, min_y, max_x, max_y = self._bounds[index]
+            if min_x <= x <= max_x and min_y <= y <= max_y:
+                return index
+        return -1
+
+    def assign(self, cached, positions):
+        """물체별 수역 index 갱신
+
+        Args:
+            cached: 이전 배정 (N,) int, -1은 미배정
+            positions: 물체 위치 (N x 2 이상, x/y 사용)
+
+        Returns:
+            새 배정 (N,) int, 수역 밖이면 -1
+        """
+        cached = np.asarray(cached, dtype=np.int64)
+        positions = np.asarray(positions, dtype=np.float64)
+        if len(self.water_bodies) == 0 or len(cached) == 0:
+            return np.full(len(cached), -1, dtype=np.int64)
+
+        x = positions[:, 0]
+        y = positions[:, 1]
+        valid = (cached >= 0) & (cached < len(self.water_bodies))
+        safe = np.where(valid, cached, 0)
+        b = self._bounds[safe]
+        inside = valid & (x >= b[:, 0]) & (x <= b[:, 2]) & (y >= b[:, 1]) & (y <= b[:, 3])
+
+        # 배정된 수역보다 먼저 검사되는 겹친 수역 안으로 들어온 물체는 다시 조회
+        for index, shadows in enumerate(self._shadows):
+            if len(shadows) == 0:
+                continue
+            members = np.flatnonzero(inside & (cached == index))
+            if len(members) == 0:
+                continue
+            sb = self._bounds[shadows]
+            mx = x[members, None]
+            my = y[members, None]
+            covered = np.any((mx >= sb[:, 0]) & (mx <= sb[:, 2]) & (my >= sb[:, 1]) & (my <= sb[:, 3]),
+                             axis=1)
+            inside[members[covered]] = False
+
+        result = np.where(inside, cached, -1)
+        for i in np.flatnonzero(~inside):
+            result[i] = self.lookup(x[i], y[i])
+        return result
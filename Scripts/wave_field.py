@@ -0,0 +1,205 @@
+"""
+Gerstner Wave 수면 계산 (numpy 전용, omni/pxr 불필요)
+"""
+import math
+
+import numpy as np
+
+
+class WaveComponents:
+    """Gerstner 파 성분 목록 (성분별 배열 + 미리 계산한 상수)
+
+    성분 개수 C에 대해 amplitude, wavelength, speed, steepness는 (C,),
+    direction은 (C, 2) 단위 벡터. 생성 시 k, omega 등을 한 번만 계산한다.
+    """
+
+    def __init__(self, amplitude, wavelength, speed, steepness, direction, normalize=True):
+        self.amplitude = np.atleast_1d(np.asarray(amplitude, dtype=np.float64))
+        self.wavelength = np.atleast_1d(np.asarray(wavelength, dtype=np.float64))
+        self.speed = np.atleast_1d(np.asarray(speed, dtype=np.float64))
+        self.steepness = np.atleast_1d(np.asarray(steepness, dtype=np.float64))
+
+        direction = np.asarray(direction, dtype=np.float64).reshape(-1, 2)
+        if normalize:
+            norm = np.linalg.norm(direction, axis=1, keepdims=True)
+            direction = direction / np.where(norm > 0, norm, 1.0)
+        self.direction = direction
+
+        # 미리 계산한 상수
+        self.k = 2 * math.pi / self.wavelength
+        self.omega = self.speed * self.k
+        self.kx = self.k * self.direction[:, 0]
+        self.ky = self.k * self.direction[:, 1]
+        # 수평 변위 계수 Q * A = steepness / k (진폭이 0이면 0)
+        qa = np.where(self.amplitude > 0, self.steepness / self.k, 0.0)
+        self.qa_x = qa * self.direction[:, 0]
+        self.qa_y = qa * self.direction[:, 1]
+        # 편미분 계수 (법선/접선)
+        self.ak_x = self.amplitude * self.kx
+        self.ak_y = self.amplitude * self.ky
+        self.qk_xx = self.qa_x * self.kx
+        self.qk_xy = self.qa_x * self.ky
+        self.qk_yy = self.qa_y * self.ky
+        # 궤도 속도 계수
+        self.aw = self.amplitude * self.omega
+        self.aw_x = self.aw * self.direction[:, 0]
+        self.aw_y = self.aw * self.direction[:, 1]
+
+    def __len__(self):
+        return len(self.amplitude)
+
+    # 기존 파라미터 방식 (2개 방향을 번갈아 사용)
+    LEGACY_DIRECTIONS = [
+        (1.0, 0.0),
+        (0.6, 0.8),
+    ]
+
+    @classmethod
+    def from_legacy(cls, amp, wlen, spd, steep, num_waves):
+        """wave:* 속성 방식 파라미터 -> 성분 목록"""
+        idx = np.arange(int(num_waves), dtype=np.float64)
+        directions = [cls.LEGACY_DIRECTIONS[i % len(cls.LEGACY_DIRECTIONS)] for i in range(int(num_waves))]
+        return cls(
+            amp * (1.0 - idx * 0.15),
+            wlen * (1.0 + idx * 0.3),
+            spd * (1.0 - idx * 0.1),
+            np.full(int(num_waves), float(steep)),
+            np.array(directions, dtype=np.float64).reshape(-1, 2),
+        )
+
+    def phases(self, x, y, time):
+        """샘플 x 성분 위상 (M x C)"""
+        x = np.asarray(x, dtype=np.float64).reshape(-1, 1)
+        y = np.asarray(y, dtype=np.float64).reshape(-1, 1)
+        return x * self.kx + y * self.ky - self.omega * time
+
+    def sample(self, x, y, time, z=None, normals=False, velocities=False, body_index=None):
+        """샘플 위치의 수면 높이, 법선, 물 입자 궤도 속도를 한 번의 위상 계산으로 구함
+
+        궤도 속도는 선형 파 이론 (높이 A sin(phase)에 대응):
+            수평 = A * omega * d * sin(phase), 연직 = -A * omega * cos(phase)
+        z를 주면 수면 아래 깊이에 따라 성분별 exp(-k * depth)로 감쇠한다.
+        body_index는 샘플별 물체 번호로, 물체마다 값이 다른 합성 수면 (RippleSurface)만 사용한다.
+
+        Returns:
+            (heights (M,), normals (M x 3) 또는 None, velocities (M x 3) 또는 None)
+        """
+        x = np.asarray(x, dtype=np.float64).ravel()
+        y = np.asarray(y, dtype=np.float64).ravel()
+        m = len(x)
+        if len(self) == 0:
+            flat = np.zeros((m, 3))
+            flat[:, 2] = 1.0
+            return (np.zeros(m), flat if normals else None,
+                    np.zeros((m, 3)) if velocities else None)
+
+        phase = self.phases(x, y, time)
+        sin_p = np.sin(phase)
+        heights = sin_p @ self.amplitude
+        cos_p = np.cos(phase) if (normals or velocities) else None
+
+        normal_out = None
+        if normals:
+            normal_out = np.empty((m, 3))
+            normal_out[:, 0] = -(cos_p @ self.ak_x)
+            normal_out[:, 1] = -(cos_p @ self.ak_y)
+            normal_out[:, 2] = 1.0
+            normal_out /= np.linalg.norm(normal_out, axis=1, keepdims=True)
+
+        velocity_out = None
+        if velocities:
+            if z is not None:
+                depth = np.maximum(heights - np.asarray(z, dtype=np.float64).ravel(), 0.0)
+                decay = np.exp(-depth[:, None] * self.k)
+                sin_p = sin_p * decay
+                cos_p = cos_p * decay
+            velocity_out = np.empty((m, 3))
+            velocity_out[:, 0] = sin_p @ self.aw_x
+            velocity_out[:, 1] = sin_p @ self.aw_y
+            velocity_out[:, 2] = -(cos_p @ self.aw)
+
+        return heights, normal_out, velocity_out
+
+    def evaluate_surface(self, x, y, time, tangents=False, out=None, offset=None, offset_slope=None):
+        """Gerstner 변위, 해석적 법선(, 접선)을 한 번의 sin/cos 계산으로 구함
+
+        Args:
+            x, y: 변형 전 격자 좌표 (M,)
+            tangents: True면 접선(+x 방향 편미분)도 계산
+            out: (points, normals, tangents) 재사용 버퍼 (float32 M x 3, tangents는 None 가능)
+            offset: 격자 좌표에서 더할 높이 (M,) (잔물결 등)
+            offset_slope: offset의 (d/dx, d/dy), 법선/접선에 반영
+
+        Returns:
+            (points, normals, tangents) 각각 (M x 3), tangents=False면 tangents는 None
+        """
+        x = np.asarray(x, dtype=np.float64).ravel()
+        y = np.asarray(y, dtype=np.float64).ravel()
+        m = len(x)
+        if out is None:
+            out = (np.empty((m, 3), dtype=np.float32), np.empty((m, 3), dtype=np.float32),
+                   np.empty((m, 3), dtype=np.float32) if tangents else None)
+        points, normals, tangent_out = out
+
+        if len(self) == 0:
+            points[:, 0] = x
+            points[:, 1] = y
+            points[:, 2] = 0.0
+            sxy = np.zeros(m)
+            tx = by = np.ones(m)
+            tz = bz = np.zeros(m)
+        else:
+            phase = self.phases(x, y, time)
+            cos_p = np.cos(phase)
+            sin_p = np.sin(phase)
+
+            points[:, 0] = x + cos_p @ self.qa_x
+            points[:, 1] = y + cos_p @ self.qa_y
+            points[:, 2] = sin_p @ self.amplitude
+
+            # dP/dx, dP/dy
+            sxy = sin_p @ self.qk_xy
+            tx = 1.0 - sin_p @ self.qk_xx
+            tz = cos_p @ self.ak_x
+            by = 1.0 - sin_p @ self.qk_yy
+            bz = cos_p @ self.ak_y
+
+        if offset is not None:
+            points[:, 2] += offset
+        if offset_slope is not None:
+            tz = tz + offset_slope[0]
+            bz = bz + offset_slope[1]
+
+        # T = (tx, -sxy, tz), B = (-sxy, by, bz), N = T x B
+        nx = -sxy * bz - tz * by
+        ny = -tz * sxy - tx * bz
+        nz = tx * by - sxy * sxy
+        inv = 1.0 / np.sqrt(nx * nx + ny * ny + nz * nz)
+        normals[:, 0] = nx * inv
+        normals[:, 1] = ny * inv
+        normals[:, 2] = nz * inv
+
+        if tangents:
+            inv_t = 1.0 / np.sqrt(tx * tx + sxy * sxy + tz * tz)
+            tangent_out[:, 0] = tx * inv_t
+            tangent_out[:, 1] = -sxy * inv_t
+            tangent_out[:, 2] = tz * inv_t
+            return points, normals, tangent_out
+        return points, normals, None
+
+    def to_array(self):
+        """float64 배열로 직렬화 (기록용)"""
+        return np.concatenate([
+            [float(len(self))],
+            self.amplitude, self.wavelength, self.speed, self.steepness,
+            self.direction.ravel(),
+        ])
+
+    @classmethod
+    def from_array(cls, values):
+        """to_array 결과에서 복원"""
+        values = np.asarray(values, dtype=np.float64)
+        c = int(values[0])
+        fields = [values[1 + i * c:1 + (i + 1) * c] for i in range(4)]
+        direction = values[1 + 4 * c:1 + 6 * c].reshape(c, 2)
+        return cls(*fields, direction, normalize=False)
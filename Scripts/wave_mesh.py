@@ -1,13 +1,68 @@
 """
 Gerstner Wave 메시 생성 및 업데이트
 """
-import math
-from pxr import UsdGeom, Gf, Sdf, UsdShade
+import numpy as np
+from pxr import UsdGeom, Sdf, UsdShade, Vt
+from .wave_field import WaveComponents
 
 
 class WaveMesh:
     """Wave Mesh 관리"""
     
+    GLASS_MATERIAL_PATH = "/World/Looks/GlassMaterial"
+    
+    @staticmethod
+    def get_glass_material(stage):
+        """투명 수면 재질 (이미 있으면 재사용)"""
+        prim = stage.GetPrimAtPath(WaveMesh.GLASS_MATERIAL_PATH)
+        if prim and prim.IsA(UsdShade.Material):
+            return UsdShade.Material(prim)
+        
+        material = UsdShade.Material.Define(stage, WaveMesh.GLASS_MATERIAL_PATH)
+        
+        shader = UsdShade.Shader.Define(stage, WaveMesh.GLASS_MATERIAL_PATH + "/Shader")
+        shader.CreateIdAttr("UsdPreviewSurface")
+        shader.CreateInput("diffuseColor", Sdf.ValueTypeNames.Color3f).Set((0.9, 0.95, 1.0))
+        shader.CreateInput("emissiveColor", Sdf.ValueTypeNames.Color3f).Set((0.0, 0.0, 0.0))
+        shader.CreateInput("useSpecularWorkflow", Sdf.ValueTypeNames.Int).Set(0)
+        shader.CreateInput("specularColor", Sdf.ValueTypeNames.Color3f).Set((0.0, 0.0, 0.0))
+        shader.CreateInput("metallic", Sdf.ValueTypeNames.Float).Set(0.0)
+        shader.CreateInput("roughness", Sdf.ValueTypeNames.Float).Set(0.0)
+        shader.CreateInput("clearcoat", Sdf.ValueTypeNames.Float).Set(0.0)
+        shader.CreateInput("clearcoatRoughness", Sdf.ValueTypeNames.Float).Set(0.0)
+        shader.CreateInput("opacity", Sdf.ValueTypeNames.Float).Set(0.05)
+        shader.CreateInput("opacityThreshold", Sdf.ValueTypeNames.Float).Set(0.0)
+        shader.CreateInput("ior", Sdf.ValueTypeNames.Float).Set(1.1)
+        shader.CreateInput("normal", Sdf.ValueTypeNames.Normal3f).Set((0.0, 0.0, 0.0))
+        shader.CreateInput("displacement", Sdf.ValueTypeNames.Float).Set(0.0)
+        
+        material.CreateSurfaceOutput().ConnectToSource(shader.ConnectableAPI(), "surface")
+        return material
+    
+    @staticmethod
+    def is_wave_mesh(stage, mesh_path, resolution):
+        """기존 Wave Mesh를 그대로 쓸 수 있는지 (같은 해상도, wave:* 속성 존재)"""
+        prim = stage.GetPrimAtPath(mesh_path)
+        if not prim or not prim.IsA(UsdGeom.Mesh) or not prim.GetAttribute("wave:size"):
+            return False
+        counts = UsdGeom.Mesh(prim).GetFaceVertexCountsAttr().Get()
+        return counts is not None and len(counts) == 2 * (resolution - 1) ** 2
+    
+    @staticmethod
+    def configure_normals(mesh):
+        """정점별 해석적 법선 사용 설정 (update_wave_mesh에서 기록, 렌더러 재계산 불필요)
+        
+        삼각형 감김 방향이 시계 방향이므로 leftHanded로 설정해 위쪽 법선과 일치시킴
+        """
+        if mesh.GetOrientationAttr().Get() != UsdGeom.Tokens.leftHanded:
+            mesh.CreateOrientationAttr().Set(UsdGeom.Tokens.leftHanded)
+        if mesh.GetSubdivisionSchemeAttr().Get() != UsdGeom.Tokens.none:
+            mesh.CreateSubdivisionSchemeAttr().Set(UsdGeom.Tokens.none)
+        if not mesh.GetNormalsAttr():
+            mesh.CreateNormalsAttr()
+        if mesh.GetNormalsInterpolation() != UsdGeom.Tokens.vertex:
+            mesh.SetNormalsInterpolation(UsdGeom.Tokens.vertex)
+    
     @staticmethod
     def create_wave_mesh(stage, mesh_path, resolution):
         """Wave Mesh 생성"""
@@ -33,111 +88,119 @@ class WaveMesh:
         mesh.GetFaceVertexCountsAttr().Set([3] * (len(faces)//3))
         mesh.GetFaceVertexIndicesAttr().Set(faces)
         
-        # Glass Material 적용
-        material_path = "/World/Looks/GlassMaterial"
-        material = UsdShade.Material.Define(stage, material_path)
+        # 정점별 해석적 법선 사용
+        WaveMesh.configure_normals(mesh)
         
-        shader = UsdShade.Shader.Define(stage, material_path + "/Shader")
-        shader.CreateIdAttr("UsdPreviewSurface")
-        shader.CreateInput("diffuseColor", Sdf.ValueTypeNames.Color3f).Set((0.9, 0.95, 1.0))
-        shader.CreateInput("emissiveColor", Sdf.ValueTypeNames.Color3f).Set((0.0, 0.0, 0.0))
-        shader.CreateInput("useSpecularWorkflow", Sdf.ValueTypeNames.Int).Set(0)
-        shader.CreateInput("specularColor", Sdf.ValueTypeNames.Color3f).Set((0.0, 0.0, 0.0))
-        shader.CreateInput("metallic", Sdf.ValueTypeNames.Float).Set(0.0)
-        shader.CreateInput("roughness", Sdf.ValueTypeNames.Float).Set(0.0)
-        shader.CreateInput("clearcoat", Sdf.ValueTypeNames.Float).Set(0.0)
-        shader.CreateInput("clearcoatRoughness", Sdf.ValueTypeNames.Float).Set(0.0)
-        shader.CreateInput("opacity", Sdf.ValueTypeNames.Float).Set(0.05)
-        shader.CreateInput("opacityThreshold", Sdf.ValueTypeNames.Float).Set(0.0)
-        shader.CreateInput("ior", Sdf.ValueTypeNames.Float).Set(1.1)
-        shader.CreateInput("normal", Sdf.ValueTypeNames.Normal3f).Set((0.0, 0.0, 0.0))
-        shader.CreateInput("displacement", Sdf.ValueTypeNames.Float).Set(0.0)
-        
-        material.CreateSurfaceOutput().ConnectToSource(shader.ConnectableAPI(), "surface")
-        UsdShade.MaterialBindingAPI(prim).Bind(material)
+        # Glass Material 적용 (이미 있으면 재사용)
+        UsdShade.MaterialBindingAPI(prim).Bind(WaveMesh.get_glass_material(stage))
         
         print("Wave mesh created with glass material")
     
+    # 성분 배열 속성 (저장되어 있으면 wave:amplitude 등 기존 파라미터 대신 사용)
+    COMPONENT_ATTRS = {
+        "amplitude": "wave:components:amplitude",
+        "wavelength": "wave:components:wavelength",
+        "speed": "wave:components:speed",
+        "steepness": "wave:components:steepness",
+        "direction": "wave:components:direction",
+    }
+    
+    @staticmethod
+    def get_wave_components(prim, cache=None):
+        """Wave prim의 파 성분 (성분 배열 속성 우선, 없으면 기존 파라미터)
+        
+        cache: 호출자가 보관하는 dict (수역별 WaterBody.mesh_cache), 기존 파라미터의 상수를 재사용
+        """
+        attrs = {name: prim.GetAttribute(attr_name) for name, attr_name in WaveMesh.COMPONENT_ATTRS.items()}
+        values = {name: attr.Get() if attr else None for name, attr in attrs.items()}
+        if all(v is not None and len(v) > 0 for v in values.values()):
+            return WaveComponents(
+                np.array(values["amplitude"]), np.array(values["wavelength"]),
+                np.array(values["speed"]), np.array(values["steepness"]),
+                np.array(values["direction"]),
+            )
+        
+        legacy = (
+            prim.GetAttribute("wave:amplitude").Get(),
+            prim.GetAttribute("wave:wavelength").Get(),
+            prim.GetAttribute("wave:speed").Get(),
+            prim.GetAttribute("wave:steepness").Get(),
+            prim.GetAttribute("wave:num_waves").Get(),
+        )
+        # 파라미터가 바뀔 때만 상수 재계산
+        cached = cache.get("legacy") if cache is not None else None
+        if cached is not None and cached[0] == legacy:
+            return cached[1]
+        components = WaveComponents.from_legacy(*legacy)
+        if cache is not None:
+            cache["legacy"] = (legacy, components)
+        return components
+    
     @staticmethod
-    def gerstner_wave(x, y, time, amplitude, wavelength, speed, steepness, direction):
-        """Gerstner Wave 계산"""
-        k = 2 * math.pi / wavelength
-        omega = speed * k
-        dx, dy = direction
-        phase = k * (dx * x + dy * y) - omega * time
-        
-        Q = steepness / (k * amplitude) if amplitude > 0 else 0
-        offset_x = Q * amplitude * dx * math.cos(phase)
-        offset_y = Q * amplitude * dy * math.cos(phase)
-        offset_z = amplitude * math.sin(phase)
-        
-        return offset_x, offset_y, offset_z
+    def set_wave_components(prim, components):
+        """파 성분을 배열 속성으로 저장 (None이면 삭제하고 기존 파라미터 사용)"""
+        if components is None:
+            for attr_name in WaveMesh.COMPONENT_ATTRS.values():
+                if prim.GetAttribute(attr_name):
+                    prim.RemoveProperty(attr_name)
+            return
+        
+        float_array = Sdf.ValueTypeNames.FloatArray
+        for name in ("amplitude", "wavelength", "speed", "steepness"):
+            prim.CreateAttribute(WaveMesh.COMPONENT_ATTRS[name], float_array).Set(
+                Vt.FloatArray.FromNumpy(getattr(components, name).astype(np.float32)))
+        prim.CreateAttribute(WaveMesh.COMPONENT_ATTRS["direction"], Sdf.ValueTypeNames.Float2Array).Set(
+            Vt.Vec2fArray.FromNumpy(components.direction.astype(np.float32)))
     
     @staticmethod
-    def get_water_height_at_position(x, y, time, amp, wlen, spd, steep, num_waves):
-        """특정 위치의 수면 높이 계산"""
-        wave_directions = [
-            (1.0, 0.0),
-            (0.6, 0.8),
-        ]
-        
-        total_offset_z = 0
-        
-        for wave_idx in range(num_waves):
-            direction = wave_directions[wave_idx % len(wave_directions)]
-            wave_amp = amp * (1.0 - wave_idx * 0.15)
-            wave_wlen = wlen * (1.0 + wave_idx * 0.3)
-            wave_spd = spd * (1.0 - wave_idx * 0.1)
-            
-            k = 2 * math.pi / wave_wlen
-            omega = wave_spd * k
-            dx, dy = direction
-            phase = k * (dx * x + dy * y) - omega * time
-            
-            total_offset_z += wave_amp * math.sin(phase)
-        
-        return total_offset_z
+    def get_base_grid(resolution, size, center=(0.0, 0.0), cache=None):
+        """변형 전 격자 좌표(월드)와 정점/법선/접선 버퍼
+        
+        cache: 호출자가 보관하는 dict (수역별 WaterBody.mesh_cache), resolution/size/center가 같으면 재사용
+        """
+        key = (resolution, size, tuple(center))
+        cached = cache.get("grid") if cache is not None else None
+        grid = cached[1] if cached is not None and cached[0] == key else None
+        if grid is None:
+            axis = (np.arange(resolution) / (resolution - 1) - 0.5) * size
+            base_x, base_y = np.meshgrid(axis + center[0], axis + center[1], indexing="ij")
+            count = resolution * resolution
+            grid = {
+                "x": base_x.ravel(),
+                "y": base_y.ravel(),
+                "points": np.empty((count, 3), dtype=np.float32),
+                "normals": np.empty((count, 3), dtype=np.float32),
+                "tangents": np.empty((count, 3), dtype=np.float32),
+            }
+            if cache is not None:
+                cache["grid"] = (key, grid)
+        return grid
     
     @staticmethod
-    def update_wave_mesh(stage, mesh_path, resolution, time, amp, wlen, spd, steep, size, num_waves):
-        """Wave Mesh 업데이트"""
-        wave_directions = [
-            (1.0, 0.0),
-            (0.6, 0.8),
-        ]
+    def update_wave_mesh(stage, mesh_path, resolution, time, wave, size, tangents=False,
+                         center=(0.0, 0.0), level=0.0, cache=None):
+        """Wave Mesh 업데이트 (정점과 해석적 법선을 한 번에 계산)
         
+        wave: WaveComponents
+        tangents: True면 primvars:tangents도 기록
+        center, level: 수역 중심 (x, y)과 수면 기준 높이 (정점은 월드 좌표로 기록)
+        cache: 격자 버퍼를 보관할 수역별 dict (WaterBody.mesh_cache)
+        """
         mesh = UsdGeom.Mesh.Get(stage, mesh_path)
-        points = []
-        
-        for i in range(resolution):
-            for j in range(resolution):
-                base_x = (i/(resolution-1) - 0.5) * size
-                base_y = (j/(resolution-1) - 0.5) * size
-                
-                total_offset_x = 0
-                total_offset_y = 0
-                total_offset_z = 0
-                
-                for wave_idx in range(num_waves):
-                    direction = wave_directions[wave_idx % len(wave_directions)]
-                    wave_amp = amp * (1.0 - wave_idx * 0.15)
-                    wave_wlen = wlen * (1.0 + wave_idx * 0.3)
-                    wave_spd = spd * (1.0 - wave_idx * 0.1)
-                    
-                    dx, dy, dz = WaveMesh.gerstner_wave(
-                        base_x, base_y, time,
-                        wave_amp, wave_wlen, wave_spd, steep,
-                        direction
-                    )
-                    
-                    total_offset_x += dx
-                    total_offset_y += dy
-                    total_offset_z += dz
-                
-                final_x = base_x + total_offset_x
-                final_y = base_y + total_offset_y
-                final_z = total_offset_z
-                
-                points.append(Gf.Vec3f(final_x, final_y, final_z))
-        
-        mesh.GetPointsAttr().Set(points)
\ No newline at end of file
+        grid = WaveMesh.get_base_grid(resolution, size, center, cache)
+        
+        points, normals, tangent_values = wave.evaluate_surface(
+            grid["x"], grid["y"], time, tangents=tangents,
+            out=(grid["points"], grid["normals"], grid["tangents"])
+        )
+        if level:
+            points[:, 2] += level
+        
+        mesh.GetPointsAttr().Set(Vt.Vec3fArray.FromNumpy(points))
+        mesh.GetNormalsAttr().Set(Vt.Vec3fArray.FromNumpy(normals))
+        if tangents:
+            primvar = UsdGeom.PrimvarsAPI(mesh).GetPrimvar("tangents")
+            if not primvar:
+                primvar = UsdGeom.PrimvarsAPI(mesh).CreatePrimvar(
+                    "tangents", Sdf.ValueTypeNames.Vector3fArray, UsdGeom.Tokens.vertex)
+            primvar.Set(Vt.Vec3fArray.FromNumpy(tangent_values))
@@ -0,0 +1,81 @@
+"""
+USD 힘/토크 기록 시간 측정 (Isaac Sim 없이 usd-core로 실행)
+
+사용법:
+    python benchmarks/bench_force_write.py
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from pxr import Usd, UsdGeom, Sdf, Gf
+
+from Scripts.force_writer import ForceWriter
+
+FRAMES = 60
+
+
+def build_stage(num_bodies):
+    """힘/토크 속성을 가진 물체 N개로 구성된 스테이지"""
+    stage = Usd.Stage.CreateInMemory()
+    UsdGeom.Xform.Define(stage, "/World")
+    paths = []
+    for i in range(num_bodies):
+        path = f"/World/Body_{i}"
+        prim = UsdGeom.Cube.Define(stage, path).GetPrim()
+        prim.CreateAttribute(ForceWriter.FORCE_ATTR, Sdf.ValueTypeNames.Float3).Set(Gf.Vec3f(0, 0, 0))
+        prim.CreateAttribute(ForceWriter.TORQUE_ATTR, Sdf.ValueTypeNames.Float3).Set(Gf.Vec3f(0, 0, 0))
+        paths.append(path)
+    return stage, paths
+
+
+def frame_values(num_bodies, frame, settled_ratio):
+    """프레임별 힘/토크 (settled_ratio 비율은 변화 없음)"""
+    settled = int(num_bodies * settled_ratio)
+    values = []
+    for i in range(num_bodies):
+        f = 0.0 if i < settled else frame * 0.5 + i
+        values.append((Gf.Vec3f(0, 0, 1000.0 + f), Gf.Vec3f(f, -f, 0)))
+    return values
+
+
+def bench_per_attribute(num_bodies, settled_ratio):
+    """기존 방식: 물체마다 Usd attribute Set 두 번"""
+    stage, paths = build_stage(num_bodies)
+    prims = [stage.GetPrimAtPath(p) for p in paths]
+    total = 0.0
+    for frame in range(FRAMES):
+        values = frame_values(num_bodies, frame, settled_ratio)
+        start = time.perf_counter()
+        for prim, (force, torque) in zip(prims, values):
+            prim.GetAttribute(ForceWriter.FORCE_ATTR).Set(force)
+            prim.GetAttribute(ForceWriter.TORQUE_ATTR).Set(torque)
+        total += time.perf_counter() - start
+    return total / FRAMES
+
+
+def bench_force_writer(num_bodies, settled_ratio):
+    """ForceWriter: ChangeBlock + Sdf spec 기록 + epsilon 생략"""
+    stage, paths = build_stage(num_bodies)
+    writer = ForceWriter(epsilon=1e-3)
+    total = 0.0
+    for frame in range(FRAMES):
+        values = frame_values(num_bodies, frame, settled_ratio)
+        start = time.perf_counter()
+        for path, (force, torque) in zip(paths, values):
+            writer.queue(path, force, torque)
+        writer.flush(stage)
+        total += time.perf_counter() - start
+    return total / FRAMES
+
+
+if __name__ == "__main__":
+    print(f"{'bodies':>8} {'settled':>8} {'before ms':>10} {'after ms':>10} {'speedup':>8}")
+    for num_bodies in (100, 1000):
+        for settled_ratio in (0.0, 0.5):
+            before = bench_per_attribute(num_bodies, settled_ratio)
+            after = bench_force_writer(num_bodies, settled_ratio)
+            print(f"{num_bodies:>8} {settled_ratio:>8.1f} {before * 1000:>10.3f} "
+                  f"{after * 1000:>10.3f} {before / after:>7.1f}x")
@@ -0,0 +1,56 @@
+"""
+패키지 import 시간 측정 (새 인터프리터에서 반복 실행, Isaac Sim 불필요)
+
+사용법:
+    python benchmarks/bench_import.py
+"""
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+RUNS = 10
+
+# 코어 모듈 전체 (omni/pxr 없이 import 가능해야 함)
+CORE_MODULES = [
+    "wave_field", "sea_state", "buoyancy_solver", "buoyancy_registry", "buoyant_object",
+    "buoyancy_prototype", "water_body", "ripple_field", "buoyancy_recorder", "batch_runner",
+]
+
+CASES = [
+    ("baseline (numpy)", "import numpy"),
+    ("import Scripts", "import Scripts"),
+    ("from Scripts import BuoyancySolver", "from Scripts import BuoyancySolver"),
+    ("all core modules", "; ".join(f"import Scripts.{m}" for m in CORE_MODULES)),
+]
+
+CHECK = "import sys; assert not any(m == 'omni' or m == 'pxr' for m in sys.modules), 'Kit module loaded'"
+
+TIMER = """
+import time
+_start = time.perf_counter()
+{code}
+_elapsed = time.perf_counter() - _start
+{check}
+print(_elapsed)
+"""
+
+
+def measure(code):
+    """새 프로세스에서 code 실행 시간 [s] 목록"""
+    times = []
+    for _ in range(RUNS):
+        out = subprocess.run(
+            [sys.executable, "-c", TIMER.format(code=code, check=CHECK)],
+            cwd=ROOT, capture_output=True, text=True, check=True,
+        )
+        times.append(float(out.stdout.strip().splitlines()[-1]))
+    return times
+
+
+if __name__ == "__main__":
+    print(f"{'case':<38}{'median ms':>10}{'min ms':>10}")
+    for name, code in CASES:
+        times = measure(code)
+        print(f"{name:<38}{statistics.median(times) * 1000:>10.2f}{min(times) * 1000:>10.2f}")
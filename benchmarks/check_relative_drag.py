@@ -0,0 +1,67 @@
+"""
+relative 항력 회귀 검사: 물과 함께 회전하는 물체는 회전 항력을 받지 않아야 함 (Isaac Sim 불필요)
+
+사용법:
+    python benchmarks/check_relative_drag.py
+"""
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from Scripts.buoyancy_prototype import BuoyancyPrototype
+from Scripts.buoyancy_solver import BuoyancySolver
+
+SIZE = np.array([3.0, 3.0, 0.2])
+FLOW_OMEGA = np.array([0.3, 0.0, 0.0])  # 물의 롤 회전 [rad/s]
+CONSTANTS = (1000.0, 9.81, 1.0, 1.0)
+
+
+class RotatingWater:
+    """수면 높이 0, 원점 중심으로 강체 회전하는 물 (BuoyancySolver의 wave 인자 형식)"""
+
+    def __init__(self, omega):
+        self.omega = np.asarray(omega, dtype=np.float64)
+
+    def sample(self, x, y, time, z=None, normals=False, velocities=False, body_index=None):
+        points = np.stack([x, y, np.zeros(len(x)) if z is None else z], axis=1)
+        flat = np.zeros((len(x), 3))
+        flat[:, 2] = 1.0
+        return (np.zeros(len(x)), flat if normals else None,
+                np.cross(self.omega, points) if velocities else None)
+
+
+def torque(water, angular_velocity):
+    """원점에 놓인 반잠김 평판의 토크"""
+    half = SIZE / 2.0
+    prototype = BuoyancyPrototype("plate", -half, half)
+    samples = prototype.get_samples(prototype.sample_counts(SIZE))
+    result = BuoyancySolver.compute_forces(
+        [samples], np.eye(4)[None], [prototype.local_volume], np.zeros((1, 3)),
+        np.asarray(angular_velocity, dtype=np.float64)[None], 0.0, water, CONSTANTS,
+        drag_model="relative")
+    return result.torques[0]
+
+
+if __name__ == "__main__":
+    still = RotatingWater(np.zeros(3))
+    rotating = RotatingWater(FLOW_OMEGA)
+    hydrostatic = torque(still, np.zeros(3))
+
+    at_rest = torque(rotating, np.zeros(3)) - hydrostatic
+    co_rotating = torque(rotating, FLOW_OMEGA) - hydrostatic
+    spinning = torque(still, FLOW_OMEGA) - hydrostatic
+
+    print(f"{'case':<34}{'drag torque x [N m]':>20}")
+    for name, value in (("at rest in rotating water", at_rest),
+                        ("rotating with the water", co_rotating),
+                        ("rotating in still water", spinning)):
+        print(f"{name:<34}{value[0]:>20.4f}")
+
+    assert np.allclose(co_rotating, 0.0, atol=1e-9), "co-rotating body must get no rotational drag"
+    assert at_rest[0] > 0.0, "rotating water must drag a body at rest along"
+    assert spinning[0] < 0.0, "still water must oppose a spinning body"
+    assert np.allclose(at_rest, -spinning), "drag must depend only on the relative rotation"
+    print("OK")